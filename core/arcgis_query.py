@@ -23,7 +23,7 @@ import json
 import time
 from typing import Tuple, Optional, Dict, List
 from shapely.geometry.base import BaseGeometry
-from utils.geometry_converters import convert_esri_to_geojson
+from utils.geometry_converters import convert_esri_to_geojson_batch
 from utils.logger import get_logger
 from geometry_input.clipping import clip_geodataframe
 
@@ -546,11 +546,7 @@ def query_arcgis_layer(
                 logger.info(f"    - Server returned {first_page_count} features")
 
             # Convert ESRI JSON to GeoDataFrame
-            features = []
-            for feature in all_esri_features:
-                geojson_feat = convert_esri_to_geojson(feature)
-                if geojson_feat:
-                    features.append(geojson_feat)
+            features = convert_esri_to_geojson_batch(all_esri_features)
 
             # Convert to GeoDataFrame
             gdf = gpd.GeoDataFrame.from_features(features, crs='EPSG:4326')
@@ -22,9 +22,7 @@ from utils.geometry_converters import (
     shapely_to_esri_polygon,
     count_geometry_vertices,
     simplify_for_query,
-    calculate_bbox_fill_ratio,
-    calculate_area_sq_miles,
-    calculate_dynamic_bbox_threshold
+    compute_area_metrics
 )
 
 logger = get_logger(__name__)
@@ -100,7 +98,9 @@ def process_all_layers(
     skipped_layers: List[str] = []
 
     if state_filter_enabled:
-        intersecting_states = get_intersecting_states(polygon_gdf, clip_buffer_miles)
+        intersecting_states = get_intersecting_states(
+            polygon_gdf, clip_buffer_miles, buffered_geom=clip_boundary
+        )
         if intersecting_states:
             layers_to_process, skipped_count, skipped_layers = filter_layers_by_state(
                 config['layers'], intersecting_states
@@ -136,9 +136,9 @@ def process_all_layers(
 
         # Calculate area and dynamic threshold
         # Larger areas need stricter thresholds (prefer polygon query to avoid hitting limits)
-        area_sq_miles = calculate_area_sq_miles(polygon_geometry)
-        bbox_fill_ratio = calculate_bbox_fill_ratio(polygon_geometry)
-        bbox_fill_threshold = calculate_dynamic_bbox_threshold(area_sq_miles)
+        area_sq_miles, bbox_fill_ratio, bbox_fill_threshold = compute_area_metrics(
+            polygon_geometry
+        )
 
         # Track in metadata
         polygon_query_metadata['area_sq_miles'] = round(area_sq_miles, 1)
@@ -21,11 +21,11 @@ from typing import Dict, List, Optional
 from shapely.ops import unary_union
 from shapely.geometry.base import BaseGeometry
 from utils.html_generators import generate_layer_download_sections, generate_layer_data_mapping
-from utils.popup_formatters import format_popup_value
+from utils.popup_formatters import escape_html, format_popup_value
 from utils.layer_control_helpers import organize_layers_by_group, generate_layer_control_data, generate_layer_geojson_data
 from utils.basemap_helpers import get_basemap_config
 from utils.js_bundler import get_leaflet_pattern_js
-from utils.pdf_generator import load_resource_areas, get_category_resource_areas
+from utils.resource_areas import load_resource_areas, get_category_resource_areas
 from config.config_loader import CONFIG_DIR
 from utils.logger import get_logger
 
@@ -34,6 +34,10 @@ logger = get_logger(__name__)
 # Template directory path
 TEMPLATES_DIR = Path(__file__).parent.parent / 'templates'
 
+# Shared Jinja2 environment so parsed templates are cached across maps.
+# Templates ship with the package, so skip the per-lookup mtime check.
+TEMPLATE_ENV = Environment(loader=FileSystemLoader(str(TEMPLATES_DIR)), auto_reload=False)
+
 
 # Override Folium's default StripePattern CDN to use our bundled fixed version
 # This eliminates the L.Mixin.Events deprecation warning by injecting
@@ -546,12 +550,12 @@ def create_web_map(
                 )
                 popup_html = f"<div style='font-size: 10px;'><i>{layer_name}</i>{resource_links}</div>"
                 if name_value:
-                    popup_html += f"<div style='font-size: 14px; font-weight: bold; margin: 5px 0;'>{name_value}</div>"
+                    popup_html += f"<div style='font-size: 14px; font-weight: bold; margin: 5px 0;'>{escape_html(name_value)}</div>"
                 popup_html += "<hr style='margin: 5px 0;'>"
 
                 for col in gdf.columns:
                     if col != 'geometry':
-                        popup_html += f"<b>{col}:</b> {format_popup_value(col, row[col])}<br>"
+                        popup_html += f"<b>{escape_html(col)}:</b> {format_popup_value(col, row[col])}<br>"
 
                 # Determine icon and color (check for unique value symbology)
                 icon_name = layer_config.get('icon', 'circle')
@@ -769,11 +773,11 @@ def create_web_map(
                     )
                     popup_html = f"<div style='font-size: 10px;'><i>{layer_name}</i>{resource_links}</div>"
                     if name_value:
-                        popup_html += f"<div style='font-size: 14px; font-weight: bold; margin: 5px 0;'>{name_value}</div>"
+                        popup_html += f"<div style='font-size: 14px; font-weight: bold; margin: 5px 0;'>{escape_html(name_value)}</div>"
                     popup_html += "<hr style='margin: 5px 0;'>"
 
                     for key, value in props.items():
-                        popup_html += f"<b>{key}:</b> {format_popup_value(key, value)}<br>"
+                        popup_html += f"<b>{escape_html(key)}:</b> {format_popup_value(key, value)}<br>"
 
                     # Store popup HTML in feature properties for Folium to use
                     feature['properties']['popup_html'] = popup_html
@@ -808,13 +812,10 @@ def create_web_map(
     # Add mouse position
     plugins.MousePosition().add_to(m)
 
-    # Setup Jinja2 template environment
-    env = Environment(loader=FileSystemLoader(str(TEMPLATES_DIR)))
-
     # Add custom basemap control with thumbnails
     logger.info("  - Adding basemap control...")
     basemaps = get_basemap_config()
-    basemap_template = env.get_template('basemap_control.html')
+    basemap_template = TEMPLATE_ENV.get_template('basemap_control.html')
     basemap_html = basemap_template.render(basemaps=basemaps)
     m.get_root().html.add_child(Element(basemap_html))
 
@@ -845,7 +846,7 @@ def create_web_map(
 
     # Render download control template
     logger.info("  - Adding download control...")
-    download_template = env.get_template('download_control.html')
+    download_template = TEMPLATE_ENV.get_template('download_control.html')
     download_html = download_template.render(
         layer_sections=generate_layer_download_sections(layer_results, config, input_filename, original_geometry_gdf),
         layer_data=generate_layer_data_mapping(layer_results, polygon_gdf, original_geometry_gdf),
@@ -1248,7 +1249,7 @@ def create_web_map(
                 """
 
     # Render side panel template
-    side_panel_template = env.get_template('side_panel.html')
+    side_panel_template = TEMPLATE_ENV.get_template('side_panel.html')
     # Use US Central timezone (UTC-6) for consistent date across local and Modal environments
     us_central = timezone(timedelta(hours=-6))
     now_central = datetime.now(us_central)
@@ -1269,7 +1270,7 @@ def create_web_map(
     groups = organize_layers_by_group(config, layer_results)
     control_data = generate_layer_control_data(groups, layer_results, config)
 
-    layer_control_template = env.get_template('layer_control_panel.html')
+    layer_control_template = TEMPLATE_ENV.get_template('layer_control_panel.html')
     layer_control_html = layer_control_template.render(
         groups=control_data['groups'],
         input_filename=base_layer_name,  # Use base name (without _buffered suffix)
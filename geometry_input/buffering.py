@@ -19,7 +19,7 @@ CONUS_ALBERS = 'EPSG:5070'  # Albers Equal Area Conic for CONUS
 WEB_MERCATOR = 'EPSG:3857'  # Web Mercator for global coverage
 
 
-def select_projected_crs(geom: BaseGeometry, original_crs: CRS) -> CRS:
+def select_projected_crs(geom: BaseGeometry, original_crs: CRS, verbose: bool = True) -> CRS:
     """
     Select appropriate projected CRS for accurate distance-based buffering.
 
@@ -33,6 +33,7 @@ def select_projected_crs(geom: BaseGeometry, original_crs: CRS) -> CRS:
     Args:
         geom: Shapely geometry (should be in EPSG:4326)
         original_crs: Original CRS of the geometry
+        verbose: Log the selected CRS at INFO (DEBUG when False)
 
     Returns:
         Projected CRS suitable for metric buffering
@@ -41,6 +42,8 @@ def select_projected_crs(geom: BaseGeometry, original_crs: CRS) -> CRS:
         UTM zones provide best accuracy for localized areas.
         Fallback CRS used if UTM determination fails or geometry spans multiple zones.
     """
+    log_info = logger.info if verbose else logger.debug
+
     try:
         # Get centroid for CRS selection
         centroid = geom.centroid
@@ -66,7 +69,7 @@ def select_projected_crs(geom: BaseGeometry, original_crs: CRS) -> CRS:
             epsg_code = 32700 + utm_zone  # WGS84 UTM South
 
         utm_crs = CRS.from_epsg(epsg_code)
-        logger.info(f"  - Selected UTM Zone {utm_zone}{hemisphere[0].upper()} (EPSG:{epsg_code}) for buffering")
+        log_info(f"  - Selected UTM Zone {utm_zone}{hemisphere[0].upper()} (EPSG:{epsg_code}) for buffering")
         return utm_crs
 
     except Exception as e:
@@ -82,16 +85,17 @@ def select_projected_crs(geom: BaseGeometry, original_crs: CRS) -> CRS:
 
         # CONUS approximate bounds: lon -125 to -66, lat 24 to 49
         if -125 <= lon <= -66 and 24 <= lat <= 49:
-            logger.info(f"  - Using fallback: Albers Equal Area Conic (EPSG:5070) for CONUS")
+            log_info(f"  - Using fallback: Albers Equal Area Conic (EPSG:5070) for CONUS")
             return CRS.from_string(CONUS_ALBERS)
         else:
-            logger.info(f"  - Using fallback: Web Mercator (EPSG:3857) for global coverage")
+            log_info(f"  - Using fallback: Web Mercator (EPSG:3857) for global coverage")
             return CRS.from_string(WEB_MERCATOR)
 
 
 def buffer_geometry_feet(geom: BaseGeometry,
                          buffer_feet: float,
-                         original_crs: CRS) -> BaseGeometry:
+                         original_crs: CRS,
+                         verbose: bool = True) -> BaseGeometry:
     """
     Buffer a geometry by specified distance in feet, return result in EPSG:4326.
 
@@ -106,6 +110,8 @@ def buffer_geometry_feet(geom: BaseGeometry,
         geom: Shapely geometry to buffer (should be in EPSG:4326)
         buffer_feet: Buffer distance in feet
         original_crs: Original CRS of the geometry
+        verbose: Log progress at INFO (DEBUG when False, e.g. for internal
+            buffers such as state detection)
 
     Returns:
         Buffered geometry in EPSG:4326
@@ -116,10 +122,12 @@ def buffer_geometry_feet(geom: BaseGeometry,
     if buffer_feet <= 0:
         raise ValueError(f"Buffer distance must be positive, got {buffer_feet} feet")
 
-    logger.info(f"Buffering geometry by {buffer_feet} feet...")
+    log_info = logger.info if verbose else logger.debug
+
+    log_info(f"Buffering geometry by {buffer_feet} feet...")
 
     # Step 1: Select projected CRS
-    projected_crs = select_projected_crs(geom, original_crs)
+    projected_crs = select_projected_crs(geom, original_crs, verbose=verbose)
 
     # Step 2: Transform to projected CRS
     transformer_to_proj = Transformer.from_crs(
@@ -136,7 +144,7 @@ def buffer_geometry_feet(geom: BaseGeometry,
 
     # Step 3: Convert buffer distance from feet to meters
     buffer_meters = buffer_feet * FEET_TO_METERS
-    logger.info(f"  - Buffer distance: {buffer_feet} ft = {buffer_meters:.2f} m")
+    log_info(f"  - Buffer distance: {buffer_feet} ft = {buffer_meters:.2f} m")
 
     # Step 4: Apply buffer
     try:
@@ -145,7 +153,7 @@ def buffer_geometry_feet(geom: BaseGeometry,
         logger.error(f"Failed to buffer geometry: {e}")
         raise ValueError(f"Buffer operation failed: {e}")
 
-    logger.info(f"  - Buffered geometry type: {buffered_projected.geom_type}")
+    log_info(f"  - Buffered geometry type: {buffered_projected.geom_type}")
 
     # Step 5: Transform back to EPSG:4326
     transformer_to_wgs84 = Transformer.from_crs(
@@ -160,7 +168,7 @@ def buffer_geometry_feet(geom: BaseGeometry,
         logger.error(f"Failed to transform buffered geometry back to EPSG:4326: {e}")
         raise ValueError(f"CRS back-transformation failed: {e}")
 
-    logger.info(f"  ✓ Buffered geometry created in EPSG:4326")
+    log_info(f"  ✓ Buffered geometry created in EPSG:4326")
 
     return buffered_wgs84
 
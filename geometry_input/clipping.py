@@ -7,6 +7,7 @@ This reduces output file sizes when large complex features intersect the project
 
 from typing import Tuple, Dict, Optional
 import geopandas as gpd
+import shapely
 from pyproj import CRS
 from shapely.geometry import (
     Point, MultiPoint, LineString, MultiLineString,
@@ -96,6 +97,23 @@ def count_vertices(geometry: BaseGeometry) -> int:
             return 0
 
 
+def count_vertices_total(geometries: gpd.GeoSeries) -> int:
+    """
+    Count total vertices across all geometries in a GeoSeries.
+
+    Vectorized equivalent of summing count_vertices() over the series: the
+    coordinate counts come from one shapely call instead of walking every
+    ring in Python. Missing (None) geometries count as zero.
+
+    Args:
+        geometries: GeoSeries of Shapely geometries
+
+    Returns:
+        Total number of vertices/coordinates in the series
+    """
+    return int(shapely.get_num_coordinates(geometries.values).sum())
+
+
 def extract_geometry_type(
     geometry: BaseGeometry,
     target_type: str
@@ -208,7 +226,7 @@ def clip_geodataframe(
     logger.info(f"  Clipping {len(gdf)} features for {layer_name}...")
 
     # Count original vertices (needed for statistics)
-    original_vertex_count = sum(count_vertices(geom) for geom in gdf.geometry if geom is not None)
+    original_vertex_count = count_vertices_total(gdf.geometry)
     clip_metadata['original_vertex_count'] = original_vertex_count
 
     # Step 1: Batch repair invalid geometries (vectorized validity check)
@@ -262,7 +280,7 @@ def clip_geodataframe(
             logger.info(f"    Removed {empty_count} features with empty geometries after clipping")
 
     # Step 5: Calculate statistics
-    clipped_vertex_count = sum(count_vertices(g) for g in clipped_gdf.geometry if g is not None)
+    clipped_vertex_count = count_vertices_total(clipped_gdf.geometry)
     clip_metadata['clipped_vertex_count'] = clipped_vertex_count
 
     # Determine if clipping actually occurred (based on vertex reduction)
@@ -421,7 +439,7 @@ def _clip_per_feature(
         logger.info(f"    Removed {len(empty_indices)} features with empty geometries after clipping")
 
     # Count clipped vertices
-    clipped_vertex_count = sum(count_vertices(geom) for geom in gdf.geometry if geom is not None)
+    clipped_vertex_count = count_vertices_total(gdf.geometry)
     clip_metadata['clipped_vertex_count'] = clipped_vertex_count
     clip_metadata['clip_failures'] = clip_failures
 
@@ -72,6 +72,7 @@ peit_image = (
         "jinja2>=3.1.0",
         "fpdf2>=2.8.0",
         "openpyxl>=3.1.0",
+        "orjson>=3.8.3",
         "fastapi[standard]",
         "vercel>=0.3.5",
         "supabase>=2.10.0",
@@ -0,0 +1,26 @@
+"""Tests for utils.json_helpers."""
+
+import json
+
+import geopandas as gpd
+from shapely.geometry import Point, box
+
+from utils.json_helpers import gdf_to_geojson_bytes
+
+
+def test_geometry_only_frame_matches_to_json():
+    # Input polygons are built as GeoDataFrame([{'geometry': geom}]), with
+    # no property columns; every feature must still be serialized
+    gdf = gpd.GeoDataFrame([{'geometry': box(-80.6, 39.6, -80.4, 39.8)}], crs='EPSG:4326')
+
+    assert json.loads(gdf_to_geojson_bytes(gdf)) == json.loads(gdf.to_json())
+
+
+def test_frame_with_properties_matches_to_json():
+    gdf = gpd.GeoDataFrame(
+        {'name': ['a', None], 'count': [1, 2]},
+        geometry=[Point(0, 0), Point(1, 1)],
+        crs='EPSG:4326'
+    )
+
+    assert json.loads(gdf_to_geojson_bytes(gdf)) == json.loads(gdf.to_json())
@@ -0,0 +1,33 @@
+"""Tests for utils.pdf_generator."""
+
+import geopandas as gpd
+from shapely.geometry import Point
+
+from config.config_loader import load_config
+from utils.pdf_generator import generate_pdf_report
+
+
+def _generate_report(output_path, area_name):
+    """Generate a one-layer PDF report whose area names are area_name."""
+    config = load_config()
+    layer = next(layer for layer in config['layers'] if layer.get('area_name_field'))
+    gdf = gpd.GeoDataFrame(
+        {layer['area_name_field']: [area_name] * 3},
+        geometry=[Point(-80.0, 40.0)] * 3,
+        crs='EPSG:4326'
+    )
+    output_path.mkdir()
+    return generate_pdf_report(
+        {layer['name']: gdf}, config, output_path, '20260101_120000',
+        project_name=area_name
+    )
+
+
+def test_reports_in_one_process_use_independent_font_subsets(tmp_path):
+    # The first report subsets the fonts to its own glyphs; a later report in
+    # the same process must still be able to use glyphs the first did not
+    first = _generate_report(tmp_path / 'first', 'AAA')
+    second = _generate_report(tmp_path / 'second', 'Río Piedras ñ Ωmega ß')
+
+    assert first is not None and first.exists()
+    assert second is not None and second.exists()
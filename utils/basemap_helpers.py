@@ -7,6 +7,7 @@ This module provides functions to:
 """
 
 import base64
+import functools
 from pathlib import Path
 from typing import List, Dict
 from utils.logger import get_logger
@@ -14,10 +15,47 @@ from utils.logger import get_logger
 logger = get_logger(__name__)
 
 
+# Map file extensions to MIME types for data URIs
+MIME_TYPES = {
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.png': 'image/png',
+    '.gif': 'image/gif',
+    '.webp': 'image/webp'
+}
+
+
+@functools.lru_cache(maxsize=16)
+def _encoded_thumbnail(path_str: str, mtime_ns: int) -> str:
+    """
+    Read and encode an image file as a base64 data URI (memoized).
+
+    The modification time is part of the cache key so a replaced file is
+    re-read, while unchanged thumbnails are served from memory.
+
+    Args:
+        path_str: Path to the image file as a string
+        mtime_ns: File modification time in nanoseconds (cache key only)
+
+    Returns:
+        Data URI string (e.g., "data:image/jpeg;base64,...")
+    """
+    image_path = Path(path_str)
+    encoded = base64.b64encode(image_path.read_bytes()).decode('utf-8')
+
+    # Detect MIME type from extension
+    mime = MIME_TYPES.get(image_path.suffix.lower(), 'image/jpeg')
+
+    return f"data:{mime};base64,{encoded}"
+
+
 def encode_image_to_base64(image_path: Path) -> str:
     """
     Convert image file to base64 data URI.
 
+    Encoded results are cached per (path, mtime), so repeated calls for an
+    unchanged file skip the disk read.
+
     Args:
         image_path: Path to the image file
 
@@ -32,21 +70,7 @@ def encode_image_to_base64(image_path: Path) -> str:
         raise FileNotFoundError(f"Thumbnail image not found: {image_path}")
 
     try:
-        with open(image_path, 'rb') as img_file:
-            encoded = base64.b64encode(img_file.read()).decode('utf-8')
-
-        # Detect MIME type from extension
-        ext = image_path.suffix.lower()
-        mime_types = {
-            '.jpg': 'image/jpeg',
-            '.jpeg': 'image/jpeg',
-            '.png': 'image/png',
-            '.gif': 'image/gif',
-            '.webp': 'image/webp'
-        }
-        mime = mime_types.get(ext, 'image/jpeg')
-
-        return f"data:{mime};base64,{encoded}"
+        return _encoded_thumbnail(str(image_path), image_path.stat().st_mtime_ns)
 
     except Exception as e:
         logger.error(f"Failed to encode image {image_path}: {e}")
@@ -13,12 +13,15 @@ Functions:
     convert_esri_linestring: Convert ESRI paths to GeoJSON LineString
     convert_esri_polygon: Convert ESRI rings to GeoJSON Polygon
     convert_esri_to_geojson: Main dispatcher for ESRI to GeoJSON conversion
+    convert_esri_to_geojson_batch: Convert a homogeneous list of ESRI features
     shapely_to_esri_polygon: Convert Shapely Polygon/MultiPolygon to ESRI JSON
     count_geometry_vertices: Count total vertices in a geometry
     simplify_for_query: Simplify geometry for server queries
 """
 
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple
+import numpy as np
+import shapely
 from shapely.geometry import Polygon, MultiPolygon
 from shapely.geometry.base import BaseGeometry
 
@@ -26,6 +29,16 @@ from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# GEOS geometry type ids (shapely.get_type_id) for Polygon and MultiPolygon
+POLYGONAL_TYPE_IDS = (3, 6)
+
+# Approximate miles per degree of latitude (and of longitude at the equator)
+MILES_PER_DEGREE = 69.0
+
+# Breakpoints for calculate_dynamic_bbox_threshold: input area (sq mi) → threshold
+BBOX_THRESHOLD_AREAS = np.array([100.0, 500.0, 1500.0, 3000.0, 4000.0])
+BBOX_THRESHOLD_VALUES = np.array([0.05, 0.50, 0.70, 0.80, 0.95])
+
 
 def convert_esri_point(geom: Dict, props: Dict) -> Optional[Dict]:
     """
@@ -49,14 +62,19 @@ def convert_esri_point(geom: Dict, props: Dict) -> Optional[Dict]:
         >>> convert_esri_point(geom, props)
         {'type': 'Feature', 'geometry': {...}, 'properties': {...}}
     """
-    if not geom or 'x' not in geom or 'y' not in geom:
+    if not geom:
+        return None
+
+    x = geom.get('x')
+    y = geom.get('y')
+    if x is None or y is None:
         return None
 
     return {
         'type': 'Feature',
         'geometry': {
             'type': 'Point',
-            'coordinates': [geom['x'], geom['y']]
+            'coordinates': [x, y]
         },
         'properties': props
     }
@@ -68,7 +86,7 @@ def convert_esri_linestring(geom: Dict, props: Dict) -> Optional[Dict]:
 
     ESRI represents polylines as arrays of paths, where each path is an array
     of coordinate pairs. Single path becomes LineString, multiple paths become
-    MultiLineString.
+    MultiLineString. The ESRI coordinate lists are reused as-is, not copied.
 
     Parameters:
     -----------
@@ -82,22 +100,18 @@ def convert_esri_linestring(geom: Dict, props: Dict) -> Optional[Dict]:
     Optional[Dict]
         GeoJSON Feature dict or None if conversion fails
     """
-    if not geom or 'paths' not in geom or not geom['paths']:
+    paths = geom.get('paths') if geom else None
+    if not paths:
         return None
 
     # Single path = LineString, multiple paths = MultiLineString
-    if len(geom['paths']) == 1:
-        coords = geom['paths'][0]
-        geom_type = 'LineString'
-    else:
-        coords = geom['paths']
-        geom_type = 'MultiLineString'
+    single = len(paths) == 1
 
     return {
         'type': 'Feature',
         'geometry': {
-            'type': geom_type,
-            'coordinates': coords
+            'type': 'LineString' if single else 'MultiLineString',
+            'coordinates': paths[0] if single else paths
         },
         'properties': props
     }
@@ -109,6 +123,7 @@ def convert_esri_polygon(geom: Dict, props: Dict) -> Optional[Dict]:
 
     ESRI represents polygons as arrays of rings, where each ring is an array
     of coordinate pairs. The first ring is the exterior, subsequent rings are holes.
+    The ESRI ring lists are reused as-is, not copied.
 
     Parameters:
     -----------
@@ -135,6 +150,14 @@ def convert_esri_polygon(geom: Dict, props: Dict) -> Optional[Dict]:
     }
 
 
+# ESRI geometry key → converter, checked in order (point, polyline, polygon)
+ESRI_GEOMETRY_CONVERTERS = (
+    ('x', convert_esri_point),
+    ('paths', convert_esri_linestring),
+    ('rings', convert_esri_polygon),
+)
+
+
 def convert_esri_to_geojson(esri_feature: Dict) -> Optional[Dict]:
     """
     Main converter dispatcher for ESRI JSON to GeoJSON.
@@ -166,20 +189,65 @@ def convert_esri_to_geojson(esri_feature: Dict) -> Optional[Dict]:
         return None
 
     # Detect geometry type by structure
-    if 'x' in geom and 'y' in geom:
-        # Point geometry
-        return convert_esri_point(geom, props)
-    elif 'paths' in geom:
-        # LineString/MultiLineString geometry
-        return convert_esri_linestring(geom, props)
-    elif 'rings' in geom:
-        # Polygon geometry
-        return convert_esri_polygon(geom, props)
+    for key, converter in ESRI_GEOMETRY_CONVERTERS:
+        if key in geom:
+            return converter(geom, props)
 
     # Unknown geometry type
     return None
 
 
+def convert_esri_to_geojson_batch(esri_features: List[Dict]) -> List[Dict]:
+    """
+    Convert a list of ESRI JSON features to GeoJSON Features.
+
+    ArcGIS query responses are homogeneous (one geometry type per layer), so
+    the converter is chosen once from the first feature with a geometry and
+    reused for the rest. Any feature it cannot convert falls back to the
+    per-feature dispatcher, so mixed input is still handled correctly.
+
+    Parameters:
+    -----------
+    esri_features : List[Dict]
+        ESRI JSON features with 'geometry' and 'attributes' keys
+
+    Returns:
+    --------
+    List[Dict]
+        GeoJSON Feature dicts (features that fail conversion are skipped)
+    """
+    converter = None
+    for esri_feature in esri_features:
+        geom = esri_feature.get('geometry')
+        if geom:
+            converter = next(
+                (fn for key, fn in ESRI_GEOMETRY_CONVERTERS if key in geom), None
+            )
+            break
+
+    if converter is None:
+        # No recognizable first geometry - convert feature by feature
+        return [
+            geojson_feat for geojson_feat in map(convert_esri_to_geojson, esri_features)
+            if geojson_feat
+        ]
+
+    features = []
+    for esri_feature in esri_features:
+        geom = esri_feature.get('geometry')
+        if not geom:
+            continue
+
+        geojson_feat = (
+            converter(geom, esri_feature.get('attributes', {}))
+            or convert_esri_to_geojson(esri_feature)
+        )
+        if geojson_feat:
+            features.append(geojson_feat)
+
+    return features
+
+
 def shapely_to_esri_polygon(geom: BaseGeometry) -> Optional[Dict]:
     """
     Convert Shapely Polygon/MultiPolygon to ESRI JSON polygon format.
@@ -210,35 +278,23 @@ def shapely_to_esri_polygon(geom: BaseGeometry) -> Optional[Dict]:
     - For MultiPolygon, rings from all component polygons are combined
     - Coordinates are [x, y] format (longitude, latitude)
     """
-    if geom is None or geom.is_empty:
+    if geom is None or shapely.is_empty(geom):
         return None
 
-    rings: List[List[List[float]]] = []
-
-    if geom.geom_type == 'Polygon':
-        # Exterior ring
-        exterior_coords = list(geom.exterior.coords)
-        rings.append([[x, y] for x, y in exterior_coords])
-
-        # Interior rings (holes)
-        for interior in geom.interiors:
-            interior_coords = list(interior.coords)
-            rings.append([[x, y] for x, y in interior_coords])
-
-    elif geom.geom_type == 'MultiPolygon':
-        for polygon in geom.geoms:
-            # Exterior ring
-            exterior_coords = list(polygon.exterior.coords)
-            rings.append([[x, y] for x, y in exterior_coords])
-
-            # Interior rings (holes)
-            for interior in polygon.interiors:
-                interior_coords = list(interior.coords)
-                rings.append([[x, y] for x, y in interior_coords])
-    else:
+    if shapely.get_type_id(geom) not in POLYGONAL_TYPE_IDS:
         # Unsupported geometry type
         return None
 
+    # Collect exterior + interior rings of every component polygon, then pull
+    # all vertices out in a single vectorized call and split them per ring
+    ring_geoms = shapely.get_rings(shapely.get_parts(geom))
+    coords = shapely.get_coordinates(ring_geoms)
+    split_points = np.cumsum(shapely.get_num_coordinates(ring_geoms))[:-1]
+
+    rings: List[List[List[float]]] = [
+        ring.tolist() for ring in np.split(coords, split_points)
+    ]
+
     return {
         'rings': rings,
         'spatialReference': {'wkid': 4326}
@@ -259,24 +315,14 @@ def count_geometry_vertices(geom: BaseGeometry) -> int:
     int
         Total number of vertices in the geometry
     """
-    if geom is None or geom.is_empty:
+    if geom is None or shapely.is_empty(geom):
         return 0
 
-    if geom.geom_type == 'Polygon':
-        count = len(geom.exterior.coords)
-        for interior in geom.interiors:
-            count += len(interior.coords)
-        return count
-
-    elif geom.geom_type == 'MultiPolygon':
-        total = 0
-        for polygon in geom.geoms:
-            total += len(polygon.exterior.coords)
-            for interior in polygon.interiors:
-                total += len(interior.coords)
-        return total
+    if shapely.get_type_id(geom) not in POLYGONAL_TYPE_IDS:
+        return 0
 
-    return 0
+    # Single GEOS call covering every ring of every component polygon
+    return int(shapely.get_num_coordinates(geom))
 
 
 def calculate_bbox_fill_ratio(geom: BaseGeometry) -> float:
@@ -298,7 +344,7 @@ def calculate_bbox_fill_ratio(geom: BaseGeometry) -> float:
         Ratio of polygon area to bounding box area (0.0 to 1.0)
         Returns 1.0 if calculation fails (defaults to envelope query)
     """
-    if geom is None or geom.is_empty:
+    if geom is None or shapely.is_empty(geom):
         return 1.0
 
     try:
@@ -319,6 +365,36 @@ def calculate_bbox_fill_ratio(geom: BaseGeometry) -> float:
         return 1.0  # Default to envelope on error
 
 
+def calculate_area_sq_miles_batch(geoms: np.ndarray) -> np.ndarray:
+    """
+    Estimate areas of many geometries in square miles in one vectorized pass.
+
+    Uses the same lat/lon approximation as calculate_area_sq_miles, with the
+    area, centroid and cosine steps evaluated over the whole array at once.
+
+    Parameters:
+    -----------
+    geoms : np.ndarray
+        Array (or GeoSeries values) of Shapely geometries in EPSG:4326
+
+    Returns:
+    --------
+    np.ndarray
+        Approximate areas in square miles (0.0 for missing/empty geometries)
+    """
+    # Get centroid latitude for scaling (bounds miny of a point is its y, and
+    # NaN for empty centroids, where get_y would raise)
+    lats = shapely.bounds(shapely.centroid(geoms))[..., 1]
+
+    # Approximate degrees to miles at each latitude
+    # 1 degree latitude ≈ 69 miles (fairly constant)
+    # 1 degree longitude ≈ 69 * cos(lat) miles
+    miles_per_deg2 = MILES_PER_DEGREE * MILES_PER_DEGREE * np.cos(np.radians(lats))
+
+    # Area in degrees² * conversion factor; NaN (missing/empty) becomes 0.0
+    return np.nan_to_num(shapely.area(geoms) * miles_per_deg2, nan=0.0)
+
+
 def calculate_area_sq_miles(geom: BaseGeometry) -> float:
     """
     Estimate area of geometry in square miles.
@@ -336,26 +412,11 @@ def calculate_area_sq_miles(geom: BaseGeometry) -> float:
     float
         Approximate area in square miles
     """
-    if geom is None or geom.is_empty:
+    if geom is None or shapely.is_empty(geom):
         return 0.0
 
     try:
-        # Get centroid latitude for scaling
-        centroid = geom.centroid
-        lat = centroid.y
-
-        # Approximate degrees to miles at this latitude
-        # 1 degree latitude ≈ 69 miles (fairly constant)
-        # 1 degree longitude ≈ 69 * cos(lat) miles
-        import math
-        lat_miles_per_deg = 69.0
-        lon_miles_per_deg = 69.0 * math.cos(math.radians(lat))
-
-        # Area in degrees² * conversion factor
-        area_deg2 = geom.area
-        area_sq_miles = area_deg2 * lat_miles_per_deg * lon_miles_per_deg
-
-        return area_sq_miles
+        return float(calculate_area_sq_miles_batch(np.asarray([geom], dtype=object))[0])
 
     except Exception:
         return 0.0
@@ -395,23 +456,32 @@ def calculate_dynamic_bbox_threshold(area_sq_miles: float) -> float:
         3000-4000 sq mi: 0.80→0.95 (very large, need near-rectangle for envelope)
         > 4000 sq mi:    0.95 (huge areas, only envelope if nearly perfect rectangle)
     """
-    if area_sq_miles < 100:
-        return 0.05
-    elif area_sq_miles < 500:
-        # Linear interpolation from 0.05 to 0.50
-        return 0.05 + (area_sq_miles - 100) / 400 * 0.45
-    elif area_sq_miles < 1500:
-        # Linear interpolation from 0.50 to 0.70
-        return 0.50 + (area_sq_miles - 500) / 1000 * 0.20
-    elif area_sq_miles < 3000:
-        # Linear interpolation from 0.70 to 0.80
-        return 0.70 + (area_sq_miles - 1500) / 1500 * 0.10
-    elif area_sq_miles < 4000:
-        # Linear interpolation from 0.80 to 0.95
-        return 0.80 + (area_sq_miles - 3000) / 1000 * 0.15
-    else:
-        # Very large areas: 0.95 (only envelope if nearly perfect rectangle)
-        return 0.95
+    # Piecewise-linear lookup; values outside the breakpoints clamp to the ends
+    return float(np.interp(area_sq_miles, BBOX_THRESHOLD_AREAS, BBOX_THRESHOLD_VALUES))
+
+
+def compute_area_metrics(geom: BaseGeometry) -> Tuple[float, float, float]:
+    """
+    Compute area, bbox fill ratio and dynamic threshold for a query geometry.
+
+    Convenience wrapper around calculate_area_sq_miles,
+    calculate_bbox_fill_ratio and calculate_dynamic_bbox_threshold, so the
+    query strategy heuristic uses the same formulas as the individual helpers.
+
+    Parameters:
+    -----------
+    geom : BaseGeometry
+        Shapely Polygon or MultiPolygon geometry in EPSG:4326
+
+    Returns:
+    --------
+    Tuple[float, float, float]
+        (area_sq_miles, bbox_fill_ratio, bbox_fill_threshold)
+    """
+    area_sq_miles = calculate_area_sq_miles(geom)
+    bbox_fill_ratio = calculate_bbox_fill_ratio(geom)
+
+    return area_sq_miles, bbox_fill_ratio, calculate_dynamic_bbox_threshold(area_sq_miles)
 
 
 def simplify_for_query(
@@ -462,17 +532,18 @@ def simplify_for_query(
 
     current_tolerance = tolerance
     simplified = geom
+    final_count = original_vertex_count
 
     for i in range(5):  # Max 5 iterations
         simplified = geom.simplify(current_tolerance, preserve_topology=True)
-        new_count = count_geometry_vertices(simplified)
+        final_count = count_geometry_vertices(simplified)
 
         logger.debug(
             f"  Iteration {i+1}: tolerance={current_tolerance:.6f}, "
-            f"vertices={new_count}"
+            f"vertices={final_count}"
         )
 
-        if new_count <= max_vertices:
+        if final_count <= max_vertices:
             break
 
         current_tolerance *= 2
@@ -480,12 +551,10 @@ def simplify_for_query(
         if current_tolerance > max_tolerance:
             logger.warning(
                 f"Reached max tolerance ({max_tolerance}), "
-                f"vertices still at {new_count}"
+                f"vertices still at {final_count}"
             )
             break
 
-    final_count = count_geometry_vertices(simplified)
-
     # Validate simplified geometry
     if simplified.is_empty or not simplified.is_valid:
         logger.warning("Simplified geometry invalid, using original")
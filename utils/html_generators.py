@@ -9,10 +9,54 @@ Functions:
     generate_layer_data_mapping: Embed GeoJSON data in JavaScript
 """
 
-import json
 import geopandas as gpd
 from typing import Dict, Optional
 
+from utils.json_helpers import gdf_to_geojson_str
+
+
+# Download formats offered for every layer: (format key, button label)
+DOWNLOAD_FORMATS = (
+    ('geojson', 'GeoJSON'),
+    ('shp', 'SHP'),
+    ('kmz', 'KMZ'),
+    ('gpkg', 'GPKG'),
+)
+
+_SECTION_TEMPLATE = """
+        <div class="download-section">
+            <div class="download-layer-name">{label}</div>
+            <div class="download-format-buttons">{buttons}
+            </div>
+        </div>
+        """
+
+_BUTTON_TEMPLATE = """
+                <button class="download-format-btn" onclick="downloadLayer('{name}', '{fmt}'); event.stopPropagation();">{fmt_label}</button>"""
+
+
+def _download_section(label: str, layer_name: str) -> str:
+    """
+    Render one download section with a button per download format.
+
+    Parameters:
+    -----------
+    label : str
+        Text shown above the buttons (e.g., "RCRA Sites (150)")
+    layer_name : str
+        Layer key passed to the downloadLayer() JavaScript function
+
+    Returns:
+    --------
+    str
+        HTML string for a single download section
+    """
+    buttons = ''.join(
+        _BUTTON_TEMPLATE.format(name=layer_name, fmt=fmt, fmt_label=fmt_label)
+        for fmt, fmt_label in DOWNLOAD_FORMATS
+    )
+    return _SECTION_TEMPLATE.format(label=label, buttons=buttons)
+
 
 def generate_layer_download_sections(
     layer_results: Dict[str, gpd.GeoDataFrame],
@@ -52,34 +96,18 @@ def generate_layer_download_sections(
             </div>
         </div>
     """
-    sections_html = ""
+    sections = []
 
     # Add original input geometry section (if buffer was applied)
     if original_geometry_gdf is not None:
-        sections_html += f"""
-        <div class="download-section">
-            <div class="download-layer-name">{input_filename} (Original Input)</div>
-            <div class="download-format-buttons">
-                <button class="download-format-btn" onclick="downloadLayer('Original Geometry', 'geojson'); event.stopPropagation();">GeoJSON</button>
-                <button class="download-format-btn" onclick="downloadLayer('Original Geometry', 'shp'); event.stopPropagation();">SHP</button>
-                <button class="download-format-btn" onclick="downloadLayer('Original Geometry', 'kmz'); event.stopPropagation();">KMZ</button>
-                <button class="download-format-btn" onclick="downloadLayer('Original Geometry', 'gpkg'); event.stopPropagation();">GPKG</button>
-            </div>
-        </div>
-        """
+        sections.append(_download_section(
+            f"{input_filename} (Original Input)", 'Original Geometry'
+        ))
 
     # Add input polygon section (buffered polygon or original if no buffering)
-    sections_html += f"""
-        <div class="download-section">
-            <div class="download-layer-name">{input_filename} (Input Area)</div>
-            <div class="download-format-buttons">
-                <button class="download-format-btn" onclick="downloadLayer('Input Polygon', 'geojson'); event.stopPropagation();">GeoJSON</button>
-                <button class="download-format-btn" onclick="downloadLayer('Input Polygon', 'shp'); event.stopPropagation();">SHP</button>
-                <button class="download-format-btn" onclick="downloadLayer('Input Polygon', 'kmz'); event.stopPropagation();">KMZ</button>
-                <button class="download-format-btn" onclick="downloadLayer('Input Polygon', 'gpkg'); event.stopPropagation();">GPKG</button>
-            </div>
-        </div>
-        """
+    sections.append(_download_section(
+        f"{input_filename} (Input Area)", 'Input Polygon'
+    ))
 
     # Add sections for each intersected layer
     for layer_config in config['layers']:
@@ -91,19 +119,9 @@ def generate_layer_download_sections(
 
         feature_count = len(layer_results[layer_name])
 
-        sections_html += f"""
-        <div class="download-section">
-            <div class="download-layer-name">{layer_name} ({feature_count})</div>
-            <div class="download-format-buttons">
-                <button class="download-format-btn" onclick="downloadLayer('{layer_name}', 'geojson'); event.stopPropagation();">GeoJSON</button>
-                <button class="download-format-btn" onclick="downloadLayer('{layer_name}', 'shp'); event.stopPropagation();">SHP</button>
-                <button class="download-format-btn" onclick="downloadLayer('{layer_name}', 'kmz'); event.stopPropagation();">KMZ</button>
-                <button class="download-format-btn" onclick="downloadLayer('{layer_name}', 'gpkg'); event.stopPropagation();">GPKG</button>
-            </div>
-        </div>
-        """
+        sections.append(_download_section(f"{layer_name} ({feature_count})", layer_name))
 
-    return sections_html
+    return ''.join(sections)
 
 
 def generate_layer_data_mapping(
@@ -140,26 +158,20 @@ def generate_layer_data_mapping(
 
     # Add original input geometry (if buffer was applied)
     if original_geometry_gdf is not None:
-        original_geojson = json.loads(original_geometry_gdf.to_json())
-        original_geojson_str = json.dumps(original_geojson, separators=(',', ':'))
         # Escape forward slashes to prevent </script> breaking out of script context
-        original_geojson_str = original_geojson_str.replace('</', '<\\/')
+        original_geojson_str = gdf_to_geojson_str(original_geometry_gdf, script_safe=True)
         mappings.append(f'"Original Geometry": {original_geojson_str}')
 
     # Add input polygon (convert GeoDataFrame to GeoJSON dict)
-    input_geojson = json.loads(polygon_gdf.to_json())
-    input_geojson_str = json.dumps(input_geojson, separators=(',', ':'))
     # Escape forward slashes to prevent </script> breaking out of script context
-    input_geojson_str = input_geojson_str.replace('</', '<\\/')
+    input_geojson_str = gdf_to_geojson_str(polygon_gdf, script_safe=True)
     # Use double quotes to avoid conflicts with apostrophes in layer names
     mappings.append(f'"Input Polygon": {input_geojson_str}')
 
     # Add each intersected layer
     for layer_name, gdf in layer_results.items():
-        layer_geojson = json.loads(gdf.to_json())
-        layer_geojson_str = json.dumps(layer_geojson, separators=(',', ':'))
         # Escape forward slashes to prevent </script> breaking out of script context
-        layer_geojson_str = layer_geojson_str.replace('</', '<\\/')
+        layer_geojson_str = gdf_to_geojson_str(gdf, script_safe=True)
         # Escape any double quotes in the layer name and use double quotes
         escaped_name = layer_name.replace('"', '\\"')
         mappings.append(f'"{escaped_name}": {layer_geojson_str}')
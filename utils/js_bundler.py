@@ -8,12 +8,14 @@ Functions:
     get_leaflet_pattern_js: Load fixed leaflet.pattern.js for inline embedding
 """
 
+import functools
 from pathlib import Path
 
 # Project root directory
 PROJECT_ROOT = Path(__file__).parent.parent
 
 
+@functools.lru_cache(maxsize=1)
 def get_leaflet_pattern_js() -> str:
     """
     Load the fixed leaflet.pattern.js library for inline embedding.
@@ -21,6 +23,8 @@ def get_leaflet_pattern_js() -> str:
     This version includes a fix for the L.Mixin.Events deprecation warning
     by using L.Evented.prototype || L.Mixin.Events for backward compatibility.
 
+    The file is read once per process; later calls return the cached string.
+
     Returns:
         str: Complete JavaScript code as a string
 
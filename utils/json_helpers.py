@@ -0,0 +1,140 @@
+"""
+JSON serialization helpers for PEIT Map Creator.
+
+This module provides fast JSON serialization for the large GeoJSON payloads
+embedded in generated maps. orjson is used when installed and the standard
+library json module is used as a fallback, so output stays valid either way.
+
+Functions:
+    load_json_file: Parse a JSON file
+    dumps_compact: Serialize an object to a compact JSON string
+    gdf_to_geojson_bytes: Serialize a GeoDataFrame to compact GeoJSON UTF-8 bytes
+    gdf_to_geojson_str: Serialize a GeoDataFrame to a compact GeoJSON string
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Union
+
+import geopandas as gpd
+import numpy as np
+import shapely
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def load_json_file(path: Union[str, Path]) -> Any:
+    """
+    Parse a JSON file.
+
+    With orjson the raw bytes are parsed directly, skipping the text decode
+    step of the standard library reader.
+
+    Args:
+        path: Path to a UTF-8 JSON file
+
+    Returns:
+        Parsed JSON value
+    """
+    if HAS_ORJSON:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def dumps_compact(obj: Any, script_safe: bool = False) -> str:
+    """
+    Serialize an object to a compact JSON string (no extra whitespace).
+
+    Args:
+        obj: JSON-serializable object (dict, list, str, number, ...)
+        script_safe: Escape '</' as '<\\/' so the JSON can be embedded inside
+            an HTML <script> element without closing it early
+
+    Returns:
+        JSON string. With orjson, non-ASCII characters are emitted as UTF-8
+        rather than \\u escapes; both forms parse to the same value.
+    """
+    if HAS_ORJSON:
+        raw = orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+        if script_safe:
+            # Escape on the bytes before decoding to avoid a second str pass
+            raw = raw.replace(b'</', b'<\\/')
+        return raw.decode('utf-8')
+
+    json_str = json.dumps(obj, separators=(',', ':'))
+    if script_safe:
+        json_str = json_str.replace('</', '<\\/')
+    return json_str
+
+
+def gdf_to_geojson_bytes(gdf: gpd.GeoDataFrame, script_safe: bool = False) -> bytes:
+    """
+    Serialize a GeoDataFrame to compact GeoJSON FeatureCollection UTF-8 bytes.
+
+    Parses to the same value as ``gdf.to_json()``. With orjson available,
+    geometries are encoded in one vectorized shapely.to_geojson call and only
+    the property dicts go through orjson, so no per-feature coordinate
+    tuples are built in Python.
+
+    Args:
+        gdf: GeoDataFrame to serialize
+        script_safe: Escape '</' for embedding inside an HTML <script> element
+
+    Returns:
+        GeoJSON FeatureCollection as UTF-8 bytes
+    """
+    if not HAS_ORJSON:
+        raw = gdf.to_json(separators=(',', ':')).encode('utf-8')
+        if script_safe:
+            raw = raw.replace(b'</', b'<\\/')
+        return raw
+
+    # Missing and empty geometries are written as null, matching to_json
+    geometries = np.array(gdf.geometry.values, dtype=object)
+    geometries[shapely.is_missing(geometries) | shapely.is_empty(geometries)] = None
+    geometry_json = shapely.to_geojson(geometries)
+
+    properties = gdf.drop(columns=gdf.geometry.name)
+    if len(properties.columns):
+        records = properties.astype(object).where(properties.notna(), None).to_dict('records')
+    else:
+        # to_dict('records') returns [] without columns; keep one per feature
+        records = [{}] * len(gdf)
+
+    option = orjson.OPT_SERIALIZE_NUMPY
+    features = b','.join([
+        b'{"id":%s,"type":"Feature","properties":%s,"geometry":%s}' % (
+            orjson.dumps(str(index)),
+            orjson.dumps(record, option=option),
+            geometry.encode('utf-8') if geometry is not None else b'null'
+        )
+        for index, record, geometry in zip(gdf.index, records, geometry_json)
+    ])
+    raw = b'{"type":"FeatureCollection","features":[' + features + b']}'
+    if script_safe:
+        raw = raw.replace(b'</', b'<\\/')
+    return raw
+
+
+def gdf_to_geojson_str(gdf: gpd.GeoDataFrame, script_safe: bool = False) -> str:
+    """
+    Serialize a GeoDataFrame to a compact GeoJSON FeatureCollection string.
+
+    Equivalent to ``gdf.to_json(separators=(',', ':'))`` for WGS84 data; see
+    gdf_to_geojson_bytes for the fast orjson path.
+
+    Args:
+        gdf: GeoDataFrame to serialize
+        script_safe: Escape '</' for embedding inside an HTML <script> element
+
+    Returns:
+        GeoJSON FeatureCollection string
+    """
+    return gdf_to_geojson_bytes(gdf, script_safe=script_safe).decode('utf-8')
@@ -6,15 +6,42 @@ and preparing data for the custom layer control panel.
 
 Functions:
     organize_layers_by_group: Group layers with features by their configured group
+    count_symbology_values: Feature counts per uppercased symbology attribute value
     generate_layer_control_data: Prepare structured data for the layer control template
+    encode_layer_geojson: Encode GeoJSON FeatureCollections for all layers as JSON bytes
     generate_layer_geojson_data: Create embedded GeoJSON data for JavaScript layer creation
 """
 
-import json
-import logging
-from collections import OrderedDict
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
 
-logger = logging.getLogger(__name__)
+import pandas as pd
+import shapely
+
+from utils.json_helpers import dumps_compact, gdf_to_geojson_bytes
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Defaults for optional layer config fields shown in the layer control panel
+LAYER_INFO_DEFAULTS = {
+    'description': '',
+    'icon': 'circle',
+    'icon_color': 'blue',
+    'color': '#3388ff',
+    'fill_opacity': 0.6
+}
+
+# Serialized GeoJSON per layer, keyed by layer name and a content hash. The
+# repeat it is meant to hit is rebuilding the map for the same job, e.g.
+# modal_app re-creating the map once the report blob URLs are known; layers
+# from different input areas essentially never match. It is therefore capped
+# by total size so a warm worker holds at most about one job's layers.
+# Insertion order doubles as recency order for LRU eviction.
+_GEOJSON_CACHE = {}
+_geojson_cache_bytes = 0
+GEOJSON_CACHE_MAX_BYTES = 64 * 1024 * 1024
 
 
 def organize_layers_by_group(config, layer_results):
@@ -26,36 +53,88 @@ def organize_layers_by_group(config, layer_results):
         layer_results (dict): Dictionary of layer_name -> GeoDataFrame for intersected layers
 
     Returns:
-        OrderedDict: Groups as keys, list of layer configs as values
-                     Only includes groups that have at least one layer with features
+        dict: Groups as keys (in config order), list of
+              (layer_config, feature_count, unique_values_symbology) tuples as values.
+              unique_values_symbology is the layer's symbology config when it uses
+              unique value symbology, otherwise None.
+              Only includes groups that have at least one layer with features
     """
-    groups = OrderedDict()
+    groups = {}
 
     for layer_config in config['layers']:
-        layer_name = layer_config['name']
-
         # Only include layers that have intersected features
-        if layer_name in layer_results and len(layer_results[layer_name]) > 0:
-            group_name = layer_config.get('group', 'Other')
+        gdf = layer_results.get(layer_config['name'])
+        if gdf is None:
+            continue
+        feature_count = len(gdf)
+        if feature_count == 0:
+            continue
+
+        group_name = layer_config.get('group', 'Other')
 
-            if group_name not in groups:
-                groups[group_name] = []
+        if group_name not in groups:
+            groups[group_name] = []
 
-            # Add layer config with feature count
-            layer_data = layer_config.copy()
-            layer_data['feature_count'] = len(layer_results[layer_name])
-            groups[group_name].append(layer_data)
+        # Resolve unique value symbology once so the control data loop only
+        # needs a None check
+        symbology = layer_config.get('symbology')
+        if not symbology or symbology.get('type') != 'unique_values':
+            symbology = None
 
-    logger.debug(f"Organized {len(layer_results)} layers into {len(groups)} groups")
+        # Add layer config with feature count (config is shared, not copied)
+        groups[group_name].append((layer_config, feature_count, symbology))
+
+    logger.debug("Organized %d layers into %d groups", len(layer_results), len(groups))
     return groups
 
 
+def count_symbology_values(gdf, symbology):
+    """
+    Count features per uppercased symbology attribute value.
+
+    Supports both a single 'field' and 'concat_fields' (joined with
+    'concat_separator', skipping empty values). For a single field the raw
+    values are counted first and only the distinct values are uppercased,
+    so per-feature work stays in pandas' hash-based value_counts() and the
+    Python-level string handling scales with the field's cardinality rather
+    than the layer size.
+
+    Args:
+        gdf (GeoDataFrame): Layer features
+        symbology (dict): Layer symbology configuration
+
+    Returns:
+        dict: Uppercased attribute string -> feature count. Missing values
+              are not counted (they never match a category)
+    """
+    if 'concat_fields' in symbology:
+        separator = symbology.get('concat_separator', ',')
+        columns = [
+            gdf[f].tolist() if f in gdf.columns else [''] * len(gdf)
+            for f in symbology['concat_fields']
+        ]
+        joined = [separator.join(str(v) for v in row if v) for row in zip(*columns)]
+        raw_counts = pd.Series(joined, dtype=object).value_counts()
+    else:
+        field = symbology['field']
+        if field not in gdf.columns:
+            return {}
+        raw_counts = gdf[field].value_counts()
+
+    # Fold distinct raw values that differ only by case (or type, e.g. 5 vs '5')
+    counts = {}
+    for value, count in raw_counts.items():
+        key = str(value).upper()
+        counts[key] = counts.get(key, 0) + int(count)
+    return counts
+
+
 def generate_layer_control_data(groups, layer_results, config):
     """
     Generate structured data for the layer control panel template.
 
     Args:
-        groups (OrderedDict): Organized groups from organize_layers_by_group
+        groups (dict): Organized groups from organize_layers_by_group
         layer_results (dict): Dictionary of layer_name -> GeoDataFrame
         config (dict): Configuration dictionary
 
@@ -73,30 +152,27 @@ def generate_layer_control_data(groups, layer_results, config):
             'name': group_name,
             'layers': [],
             'layer_count': len(layers),
-            'feature_count': sum(layer['feature_count'] for layer in layers)
+            'feature_count': 0
         }
 
-        for layer in layers:
+        for layer, feature_count, symbology in layers:
             layer_info = {
+                **LAYER_INFO_DEFAULTS,
+                **{key: layer[key] for key in LAYER_INFO_DEFAULTS.keys() & layer.keys()},
                 'name': layer['name'],
-                'description': layer.get('description', ''),
                 'group': group_name,
-                'feature_count': layer['feature_count'],
-                'geometry_type': layer['geometry_type'],
-                'icon': layer.get('icon', 'circle'),
-                'icon_color': layer.get('icon_color', 'blue'),
-                'color': layer.get('color', '#3388ff'),
-                'fill_color': layer.get('fill_color', layer.get('color', '#3388ff')),
-                'fill_opacity': layer.get('fill_opacity', 0.6)
+                'feature_count': feature_count,
+                'geometry_type': layer['geometry_type']
             }
+            # Fill color falls back to the (possibly defaulted) outline color
+            layer_info['fill_color'] = layer.get('fill_color', layer_info['color'])
 
             # Add fill_pattern if present (for hatched polygon symbols)
             if 'fill_pattern' in layer:
                 layer_info['fill_pattern'] = layer['fill_pattern']
 
             # Add symbology category symbols if unique value symbology is used
-            if 'symbology' in layer and layer['symbology'].get('type') == 'unique_values':
-                symbology = layer['symbology']
+            if symbology is not None:
                 layer_name = layer['name']
                 geometry_type = layer.get('geometry_type', 'polygon')  # Detect geometry type
                 category_symbols = []
@@ -105,26 +181,27 @@ def generate_layer_control_data(groups, layer_results, config):
                 gdf = layer_results.get(layer_name)
 
                 if gdf is not None and not gdf.empty:
+                    # Feature count per distinct uppercased attribute value, computed
+                    # once per layer (missing values are dropped and never match)
+                    value_counts = count_symbology_values(gdf, symbology)
+
+                    # Values matched by any category (reused for the default category)
+                    matched_values = set()
+
+                    # Uppercased value set per category, built once per layer
+                    categories = symbology.get('categories', [])
+                    upper_value_sets = [
+                        frozenset(str(v).upper() for v in category['values'])
+                        for category in categories
+                    ]
+
                     # Count features per category
-                    for category in symbology.get('categories', []):
+                    for category, upper_values in zip(categories, upper_value_sets):
                         label = category['label']
-                        values = category['values']
 
                         # Count features matching this category (case-insensitive)
-                        count = 0
-                        for _, row in gdf.iterrows():
-                            # Get the attribute value (support concatenated fields)
-                            if 'concat_fields' in symbology:
-                                concat_fields = symbology['concat_fields']
-                                separator = symbology.get('concat_separator', ',')
-                                field_values = [row.get(f, '') for f in concat_fields]
-                                attr_value = separator.join(str(v) for v in field_values if v)
-                            else:
-                                attr_value = row.get(symbology['field'])
-
-                            if attr_value is not None:
-                                if any(str(attr_value).upper() == str(v).upper() for v in values):
-                                    count += 1
+                        matched_values |= upper_values
+                        count = sum(value_counts.get(value, 0) for value in upper_values)
 
                         # Skip zero-count categories (matches default_category behavior)
                         if count == 0:
@@ -171,26 +248,7 @@ def generate_layer_control_data(groups, layer_results, config):
                         label = default['label']
 
                         # Count unmapped features
-                        count = 0
-                        for _, row in gdf.iterrows():
-                            # Get the attribute value (support concatenated fields)
-                            if 'concat_fields' in symbology:
-                                concat_fields = symbology['concat_fields']
-                                separator = symbology.get('concat_separator', ',')
-                                field_values = [row.get(f, '') for f in concat_fields]
-                                attr_value = separator.join(str(v) for v in field_values if v)
-                            else:
-                                attr_value = row.get(symbology['field'])
-                            matched = False
-
-                            if attr_value is not None:
-                                for category in symbology.get('categories', []):
-                                    if any(str(attr_value).upper() == str(v).upper() for v in category['values']):
-                                        matched = True
-                                        break
-
-                            if not matched:
-                                count += 1
+                        count = len(gdf) - sum(value_counts.get(value, 0) for value in matched_values)
 
                         if count > 0:  # Only add if there are unmapped features
                             # Extract attributes based on geometry type
@@ -228,15 +286,129 @@ def generate_layer_control_data(groups, layer_results, config):
                 layer_info['category_symbols'] = category_symbols
 
             group_info['layers'].append(layer_info)
-            control_data['total_features'] += layer['feature_count']
+            group_info['feature_count'] += feature_count
+            control_data['total_features'] += feature_count
 
         control_data['groups'].append(group_info)
         control_data['total_layers'] += len(layers)
 
-    logger.info(f"Generated control data: {control_data['total_layers']} layers in {len(groups)} groups")
+    logger.info(
+        "Generated control data: %d layers in %d groups",
+        control_data['total_layers'], len(groups)
+    )
     return control_data
 
 
+def _geojson_cache_key(name, gdf):
+    """
+    Build a content-based cache key for a layer's serialized GeoJSON.
+
+    Hashes every geometry's WKB plus the property values and index, so any
+    change to the features produces a different key.
+
+    Args:
+        name (str): Layer name
+        gdf (GeoDataFrame): Layer features
+
+    Returns:
+        tuple or None: Cache key, or None if the properties cannot be hashed
+                       (e.g. list or dict values), in which case the layer is
+                       not cached
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for wkb in shapely.to_wkb(gdf.geometry.values):
+        digest.update(wkb if wkb is not None else b'\x00')
+
+    try:
+        properties = gdf.drop(columns=gdf.geometry.name)
+        digest.update(pd.util.hash_pandas_object(properties, index=True).values.tobytes())
+    except TypeError:
+        return None
+
+    digest.update('\x00'.join(map(str, gdf.columns)).encode('utf-8'))
+    return (name, len(gdf), digest.digest())
+
+
+def _serialize_layer(gdf):
+    """Serialize one layer to script-safe compact GeoJSON bytes."""
+    return gdf_to_geojson_bytes(gdf, script_safe=True)
+
+
+def _serialize_layers(gdfs):
+    """
+    Serialize several layers, in parallel threads when more than one core is available.
+
+    shapely.to_geojson releases the GIL while encoding geometries, so layers
+    can overlap their geometry encoding. Each call only reads its own
+    GeoDataFrame.
+
+    Args:
+        gdfs (list): GeoDataFrames to serialize
+
+    Returns:
+        list: GeoJSON bytes for each GeoDataFrame, in input order
+    """
+    workers = min(len(gdfs), os.cpu_count() or 1)
+    if workers <= 1:
+        return [_serialize_layer(gdf) for gdf in gdfs]
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_serialize_layer, gdfs))
+
+
+def encode_layer_geojson(layer_results, polygon_gdf):
+    """
+    Encode the input polygon and every non-empty layer as one JSON object.
+
+    Each layer's FeatureCollection is serialized with gdf_to_geojson_bytes
+    and the pieces are joined directly, so the combined payload is never
+    held as a nested Python dict. Encodings are cached by layer content, so
+    unchanged layers are not re-serialized on repeated runs; cache misses
+    are serialized concurrently across layers.
+
+    Args:
+        layer_results (dict): Dictionary of layer_name -> GeoDataFrame
+        polygon_gdf (GeoDataFrame): Input polygon GeoDataFrame
+
+    Returns:
+        tuple: (bytes, int) compact JSON object mapping layer name to GeoJSON
+               FeatureCollection (escaped for <script> embedding), and the
+               number of layers it contains
+    """
+    # Add input polygon, then each layer
+    entries = [('Input Polygon', polygon_gdf)]
+    entries.extend((name, gdf) for name, gdf in layer_results.items() if len(gdf) > 0)
+
+    global _geojson_cache_bytes
+
+    # Cache lookups and updates stay on this thread; only encoding is parallel
+    keys = [_geojson_cache_key(name, gdf) for name, gdf in entries]
+    encoded = [_GEOJSON_CACHE.pop(key, None) if key is not None else None for key in keys]
+    _geojson_cache_bytes -= sum(len(data) for data in encoded if data is not None)
+    misses = [i for i, data in enumerate(encoded) if data is None]
+    if len(misses) < len(entries):
+        logger.debug("Reusing cached GeoJSON for %d layers", len(entries) - len(misses))
+
+    for i, data in zip(misses, _serialize_layers([entries[i][1] for i in misses])):
+        encoded[i] = data
+
+    for key, data in zip(keys, encoded):
+        if key is None or len(data) > GEOJSON_CACHE_MAX_BYTES:
+            continue
+        # (Re)insert at the end to mark as most recently used
+        _GEOJSON_CACHE[key] = data
+        _geojson_cache_bytes += len(data)
+        while _geojson_cache_bytes > GEOJSON_CACHE_MAX_BYTES:
+            # Evict the least recently used entry
+            _geojson_cache_bytes -= len(_GEOJSON_CACHE.pop(next(iter(_GEOJSON_CACHE))))
+
+    members = [
+        dumps_compact(name, script_safe=True).encode('utf-8') + b':' + data
+        for (name, _), data in zip(entries, encoded)
+    ]
+    return b'{' + b','.join(members) + b'}', len(members)
+
+
 def generate_layer_geojson_data(layer_results, polygon_gdf):
     """
     Generate embedded GeoJSON data for JavaScript layer creation.
@@ -251,21 +423,12 @@ def generate_layer_geojson_data(layer_results, polygon_gdf):
     Returns:
         str: JavaScript object definition string ready for HTML embedding
     """
-    geojson_data = {}
-
-    # Add input polygon
-    geojson_data['Input Polygon'] = json.loads(polygon_gdf.to_json())
+    # Compact JSON - the payload is only read by the browser, so indentation
+    # would just add bytes. Forward slashes are escaped to prevent </script>
+    # breaking out of script context
+    json_bytes, layer_count = encode_layer_geojson(layer_results, polygon_gdf)
+    js_object = "const layerGeoJSON = " + json_bytes.decode('utf-8') + ";"
 
-    # Add each layer
-    for layer_name, gdf in layer_results.items():
-        if len(gdf) > 0:
-            geojson_data[layer_name] = json.loads(gdf.to_json())
-
-    # Convert to JavaScript object format
-    json_str = json.dumps(geojson_data, indent=2)
-    # Escape forward slashes to prevent </script> breaking out of script context
-    json_str = json_str.replace('</', '<\\/')
-    js_object = "const layerGeoJSON = " + json_str + ";"
-
-    logger.debug(f"Generated GeoJSON data for {len(geojson_data)} layers")
+    logger.debug("Generated GeoJSON data for %d layers", layer_count)
     return js_object
+
@@ -23,7 +23,11 @@ from datetime import datetime
 from typing import Optional
 
 
-def setup_logging(log_dir: Optional[Path] = None) -> Path:
+# Log file of the current setup_logging() configuration (None until configured)
+_active_log_file: Optional[Path] = None
+
+
+def setup_logging(log_dir: Optional[Path] = None, force: bool = False) -> Path:
     """
     Setup logging to console and file.
 
@@ -31,29 +35,49 @@ def setup_logging(log_dir: Optional[Path] = None) -> Path:
     - Console: INFO level with clean formatting
     - File: DEBUG level with timestamps and module names
 
+    Repeated calls for the same log directory reuse the existing handlers and
+    log file. Calling with a different directory (e.g. a new per-job temp dir)
+    or with force=True closes the old handlers and starts a new log file.
+
     Parameters:
     -----------
     log_dir : Optional[Path]
         Directory for log files. Defaults to PROJECT_ROOT/logs
+    force : bool
+        Reconfigure even if logging is already set up for log_dir
 
     Returns:
     --------
     Path
-        Path to the created log file
+        Path to the active log file
     """
+    global _active_log_file
+
     if log_dir is None:
         log_dir = Path(__file__).parent.parent / 'logs'
+
+    # Get root logger for peit
+    logger = logging.getLogger('peit')
+
+    if (
+        not force
+        and _active_log_file is not None
+        and _active_log_file.parent == log_dir
+        and logger.handlers
+    ):
+        return _active_log_file
+
     log_dir.mkdir(exist_ok=True)
 
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     log_file = log_dir / f'peit_{timestamp}.log'
 
-    # Get root logger for peit
-    logger = logging.getLogger('peit')
     logger.setLevel(logging.DEBUG)
 
-    # Remove existing handlers to avoid duplicates
-    logger.handlers.clear()
+    # Close and remove existing handlers to avoid duplicates and leaked file handles
+    for handler in logger.handlers[:]:
+        logger.removeHandler(handler)
+        handler.close()
 
     # Console handler (INFO level) - clean output for users
     console = logging.StreamHandler(sys.stdout)
@@ -73,6 +97,8 @@ def setup_logging(log_dir: Optional[Path] = None) -> Path:
     logger.addHandler(console)
     logger.addHandler(file_handler)
 
+    _active_log_file = log_file
+
     # Log the setup
     logger.debug(f"Logging initialized: {log_file}")
 
@@ -10,21 +10,42 @@ The PDF includes clickable hyperlinks for all resource area codes.
 Uses fpdf2 for pure Python PDF generation with automatic table header repetition.
 """
 
-import json
 import logging
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timezone, timedelta
 
 import geopandas as gpd
+import numpy as np
+import pandas as pd
 from fpdf import FPDF
 from fpdf.fonts import FontFace
 from fpdf.enums import TableCellFillMode
 
+from utils.resource_areas import get_category_resource_areas, load_resource_areas
+
 # Get logger
 logger = logging.getLogger(__name__)
 
 
+@dataclass(slots=True)
+class TableRows:
+    """
+    Body table rows stored column-wise (one list per column).
+
+    Parallel lists avoid allocating a dict per feature for large reports;
+    index i across the lists forms row i.
+    """
+
+    categories: List[str] = field(default_factory=list)
+    layer_names: List[str] = field(default_factory=list)
+    area_names: List[str] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.categories)
+
+
 class ReportPDF(FPDF):
     """Custom PDF class with landscape orientation and page numbers."""
 
@@ -48,8 +69,6 @@ class ReportPDF(FPDF):
 
     def _load_unicode_fonts(self):
         """Load DejaVu Sans Unicode fonts for all styles to support special characters."""
-        from pathlib import Path
-
         # Get project root directory
         project_root = Path(__file__).parent.parent
         fonts_dir = project_root / 'fonts'
@@ -89,57 +108,6 @@ class ReportPDF(FPDF):
             self.set_text_color(0, 0, 0)  # Reset to black
 
 
-def load_resource_areas(config_dir: Path) -> Dict[str, Dict[str, str]]:
-    """
-    Load resource area mappings from JSON file.
-
-    Args:
-        config_dir: Path to configuration directory
-
-    Returns:
-        Dictionary mapping resource area codes to data
-        Example: {"1.4": {"name": "Water Resources", "url": "https://..."}}
-    """
-    resource_areas_file = config_dir / 'resource_areas.json'
-
-    try:
-        with open(resource_areas_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        # Convert list of dicts to code -> {name, URL} mapping
-        mapping = {}
-        for item in data:
-            code = item['resource_area'].replace('Resource Area ', '')
-            mapping[code] = {
-                'name': item['name'],
-                'url': item['url']
-            }
-
-        logger.debug(f"Loaded {len(mapping)} resource area mappings")
-        return mapping
-
-    except Exception as e:
-        logger.error(f"Failed to load resource areas: {e}")
-        return {}
-
-
-def get_category_resource_areas() -> Dict[str, List[str]]:
-    """
-    Define mapping from category (group) to resource area codes.
-
-    Returns:
-        Dictionary mapping category names to lists of resource area codes
-    """
-    return {
-        'EPA Programs': ['1.4', '1.9', '1.11'],
-        'Federal/Tribal Land': ['1.7', '1.8'],
-        'Historic Places': ['1.8'],
-        'Floodplains': ['1.4', '1.5'],
-        'Infrastructure': ['1.1'],
-        'Critical Habitats': ['1.6', '1.10']
-    }
-
-
 def create_cover_page(
     pdf: ReportPDF,
     project_name: str,
@@ -216,81 +184,92 @@ def render_table_header(
     pdf.set_text_color(0, 0, 0)  # Reset to black
 
 
+def column_max_chars(col_widths: tuple) -> tuple:
+    """
+    Approximate how many characters fit in each column.
+
+    Args:
+        col_widths: Column widths
+
+    Returns:
+        Tuple of maximum character counts, one per column
+    """
+    return tuple(int(width / 2.5) for width in col_widths)
+
+
+def truncate_text(text: str, max_chars: int) -> str:
+    """Truncate text with an ellipsis if it exceeds max_chars."""
+    if len(text) > max_chars:
+        return text[:max_chars-3] + "..."
+    return text
+
+
 def render_table_row(
     pdf: ReportPDF,
-    row_data: Dict,
+    category: str,
+    layer_name: str,
+    area_name: str,
     col_widths: tuple,
+    max_chars: tuple,
     row_height: int,
-    url_mapping: Dict,
-    category_resources: Dict,
+    category_resource_text: Dict[str, Tuple[str, Optional[str]]],
     row_index: int
 ) -> None:
     """
     Render a single table row with markdown hyperlinks in Resource Areas column.
 
+    Uses the current font (set once by create_body_table).
+
     Args:
         pdf: ReportPDF instance
-        row_data: Dict with 'category', 'layer_name', 'area_name'
+        category: Category (group) name
+        layer_name: Layer display name
+        area_name: Feature area name
         col_widths: Column widths
+        max_chars: Maximum characters per column (from column_max_chars)
         row_height: Row height
-        url_mapping: Resource area code -> URL mapping
-        category_resources: Category -> resource codes mapping
+        category_resource_text: Category -> (text, link) for the Resource
+            Areas cell (from build_category_resource_text)
         row_index: Row number for alternating colors
     """
-    # Alternating row colors
-    if row_index % 2 == 0:
-        pdf.set_fill_color(249, 249, 249)  # Light gray
-    else:
-        pdf.set_fill_color(255, 255, 255)  # White
+    # Alternating row colors: light gray rows are filled, white rows are left
+    # unfilled (the page is already white), so no fill ops are emitted for them
+    fill = row_index % 2 == 0
+    if fill:
+        pdf.set_fill_color(249, 249, 249)  # Light gray (no-op if already set)
 
     # Get data
-    category = row_data['category']
-    layer_name = row_data['layer_name']
-    area_name = row_data['area_name']
-    resource_codes = category_resources.get(category, [])
+    resource_text, resource_link = category_resource_text.get(category, ('', None))
 
     # Row starting position
     x_start = pdf.l_margin
     y_start = pdf.get_y()
 
-    # Font for regular cells
-    pdf.set_font("DejaVuSans", style="B", size=10)
-
-    # Helper function to truncate text if it exceeds column width
-    def truncate_text(text, width):
-        """Truncate text to fit within column width."""
-        max_chars = int(width / 2.5)  # Approximate chars that fit
-        if len(text) > max_chars:
-            return text[:max_chars-3] + "..."
-        return text
-
     # Column 1: Category (truncated if needed)
     pdf.set_xy(x_start, y_start)
-    pdf.cell(col_widths[0], row_height, truncate_text(category, col_widths[0]), border=1, fill=True)
+    pdf.cell(col_widths[0], row_height, truncate_text(category, max_chars[0]), border=1, fill=fill)
 
     # Column 2: Layer Name (truncated if needed)
     pdf.set_xy(x_start + col_widths[0], y_start)
-    pdf.cell(col_widths[1], row_height, truncate_text(layer_name, col_widths[1]), border=1, fill=True)
+    pdf.cell(col_widths[1], row_height, truncate_text(layer_name, max_chars[1]), border=1, fill=fill)
 
     # Column 3: Area Name (truncated if needed)
     pdf.set_xy(x_start + col_widths[0] + col_widths[1], y_start)
-    pdf.cell(col_widths[2], row_height, truncate_text(area_name, col_widths[2]), border=1, fill=True)
+    pdf.cell(col_widths[2], row_height, truncate_text(area_name, max_chars[2]), border=1, fill=fill)
 
     # Column 4: Resource Areas (markdown links)
     pdf.set_xy(x_start + col_widths[0] + col_widths[1] + col_widths[2], y_start)
 
-    if resource_codes:
-        # Build markdown links: [1.4](url1), [1.9](url2), [1.11](url3)
-        links = []
-        for code in resource_codes:
-            url = url_mapping.get(code, {}).get('url', '')
-            if url:
-                links.append(f"[{code}]({url})")
-            else:
-                links.append(code)  # Plain text if no URL
-
-        resource_text = ", ".join(links)
-
+    if resource_link:
+        # Single linked code: a plain underlined cell renders the same as the
+        # markdown link without running the markdown parser
+        pdf.set_text_color(0, 0, 255)  # Blue
+        pdf.set_font(style="BU")
+        pdf.cell(col_widths[3], row_height, resource_text, border=1, fill=fill, link=resource_link)
+        pdf.set_font(style="B")
+        pdf.set_text_color(0, 0, 0)
+        pdf.ln(row_height)
+    elif resource_text:
         # Set link color to blue and enable markdown
         pdf.set_text_color(0, 0, 255)  # Blue
 
@@ -300,7 +279,7 @@ def render_table_row(
             row_height,
             resource_text,
             border=1,
-            fill=True,
+            fill=fill,
             markdown=True,
             align="L"
         )
@@ -309,13 +288,59 @@ def render_table_row(
         pdf.set_text_color(0, 0, 0)
     else:
         # No resource areas
-        pdf.cell(col_widths[3], row_height, "-", border=1, fill=True)
+        pdf.cell(col_widths[3], row_height, "-", border=1, fill=fill)
         pdf.ln(row_height)
 
 
+def build_category_resource_text(
+    url_mapping: Dict[str, Dict[str, str]],
+    category_resources: Dict[str, List[str]]
+) -> Dict[str, Tuple[str, Optional[str]]]:
+    """
+    Build the Resource Areas cell text for each category.
+
+    The text only depends on the category, so it is built once per report
+    instead of once per row.
+
+    Args:
+        url_mapping: Resource area code to URL/name mapping
+        category_resources: Category to resource area codes mapping
+
+    Returns:
+        Dictionary mapping category names to (text, link) tuples. For a
+        single code with a URL, text is the code and link is its URL;
+        otherwise link is None and text is markdown link text, e.g.
+        "[1.4](url1), [1.9](url2), [1.11](url3)". Categories without
+        resource codes are omitted.
+    """
+    category_text = {}
+    for category, resource_codes in category_resources.items():
+        if not resource_codes:
+            continue
+
+        if len(resource_codes) == 1:
+            code = resource_codes[0]
+            url = url_mapping.get(code, {}).get('url', '')
+            if url:
+                category_text[category] = (code, url)
+                continue
+
+        links = []
+        for code in resource_codes:
+            url = url_mapping.get(code, {}).get('url', '')
+            if url:
+                links.append(f"[{code}]({url})")
+            else:
+                links.append(code)  # Plain text if no URL
+
+        category_text[category] = (", ".join(links), None)
+
+    return category_text
+
+
 def create_body_table(
     pdf: ReportPDF,
-    table_rows: List[Dict],
+    table_rows: TableRows,
     url_mapping: Dict[str, Dict[str, str]],
     category_resources: Dict[str, List[str]]
 ) -> None:
@@ -327,42 +352,72 @@ def create_body_table(
 
     Args:
         pdf: ReportPDF instance
-        table_rows: List of row dictionaries with category, layer_name, area_name
+        table_rows: Column-wise category, layer_name, area_name values
         url_mapping: Resource area code to URL/name mapping
         category_resources: Category to resource area codes mapping
     """
+    # Nothing to tabulate (see create_empty_body_note)
+    if not table_rows:
+        return
+
     pdf.add_page()
 
     # Table configuration
     col_widths = (60, 80, 70, 50)  # Category, Layer, Area, Resource
+    max_chars = column_max_chars(col_widths)
     row_height = 7
     page_bottom_margin = 15  # Space to leave at bottom for footer (reduced for more rows)
 
-    # Set body font
+    # Resource Areas cell text per category
+    category_resource_text = build_category_resource_text(url_mapping, category_resources)
+
+    # Set body font (shared by the header and all data rows)
     pdf.set_font("DejaVuSans", style="B", size=10)
 
     # Render initial header
     render_table_header(pdf, col_widths, row_height)
 
+    # Lowest y at which a row (plus footer space) still fits on the page.
+    # Page size and margins are fixed, so this replaces a will_page_break()
+    # call per row with a plain comparison.
+    last_row_y = pdf.page_break_trigger - (row_height + page_bottom_margin)
+
     # Render data rows (automatically handles ANY number of rows)
-    for i, row_data in enumerate(table_rows):
+    rows = zip(table_rows.categories, table_rows.layer_names, table_rows.area_names)
+    for i, (category, layer_name, area_name) in enumerate(rows):
         # Check if we need a page break
-        if pdf.will_page_break(row_height + page_bottom_margin):
+        if pdf.get_y() > last_row_y:
             pdf.add_page()
             render_table_header(pdf, col_widths, row_height)
 
         # Render row
         render_table_row(
             pdf,
-            row_data,
+            category,
+            layer_name,
+            area_name,
             col_widths,
+            max_chars,
             row_height,
-            url_mapping,
-            category_resources,
+            category_resource_text,
             i
         )
 
 
+def create_empty_body_note(pdf: ReportPDF, message: str) -> None:
+    """
+    Create a body page with a short note instead of an empty table.
+
+    Args:
+        pdf: ReportPDF instance
+        message: Note to display, e.g. "No intersecting features found."
+    """
+    pdf.add_page()
+    pdf.set_font("DejaVuSans", size=10)
+    pdf.ln(10)
+    pdf.cell(0, 10, message, align="C", new_x="LMARGIN", new_y="NEXT")
+
+
 def create_bmp_end_page(
     pdf: ReportPDF,
     resource_links: List[Dict],
@@ -388,11 +443,8 @@ def create_bmp_end_page(
     pdf.set_font("DejaVuSans", style="U", size=10)
     pdf.set_text_color(0, 0, 255)  # Blue
 
-    # Center the link
-    link_width = pdf.get_string_width(bmp_master_url)
-    x_position = (pdf.w - link_width) / 2
-    pdf.set_x(x_position)
-    pdf.cell(link_width, 6, bmp_master_url, link=bmp_master_url, align="C", new_x="LMARGIN", new_y="NEXT")
+    # Full-width cell centered between the (symmetric) margins
+    pdf.cell(0, 6, bmp_master_url, link=bmp_master_url, align="C", new_x="LMARGIN", new_y="NEXT")
 
     # Reset text color
     pdf.set_text_color(0, 0, 0)
@@ -443,8 +495,10 @@ def prepare_resource_links(url_mapping: Dict[str, Dict[str, str]]) -> List[Dict]
     Returns:
         List of dicts with code, name, url for each resource area
     """
+    # Sort codes naturally by numeric parts ("1.9" before "1.10"); float()
+    # would read "1.10" as 1.1 and place it next to "1.1"
     links = []
-    for code in sorted(url_mapping.keys(), key=lambda x: float(x)):
+    for code in sorted(url_mapping, key=lambda x: tuple(int(part) for part in x.split('.'))):
         links.append({
             'code': f'Resource Area {code}',
             'name': url_mapping[code]['name'],
@@ -458,7 +512,7 @@ def prepare_table_rows(
     config: Dict,
     category_resources: Dict[str, List[str]],
     metadata: Optional[Dict[str, Dict]] = None
-) -> List[Dict]:
+) -> TableRows:
     """
     Prepare table rows for PDF from layer results.
 
@@ -473,9 +527,9 @@ def prepare_table_rows(
         metadata: Optional query metadata for detecting incomplete results
 
     Returns:
-        List of row dictionaries ready for rendering
+        TableRows with one entry per feature, ready for rendering
     """
-    rows = []
+    rows = TableRows()
     layer_config_map = {layer['name']: layer for layer in config['layers']}
 
     # Build set of incomplete layer names for quick lookup
@@ -504,44 +558,51 @@ def prepare_table_rows(
         if not area_name_field or area_name_field not in gdf.columns:
             continue
 
-        # Add one row per feature
-        for idx, row in gdf.iterrows():
-            area_name = row.get(area_name_field, 'N/A')
-
-            if area_name is None or (isinstance(area_name, str) and not area_name.strip()):
-                area_name = 'N/A'
-
-            # Check if layer uses unique value symbology
-            # Start with display_layer_name which may include "(INCOMPLETE)" suffix
-            layer_display_name = display_layer_name
-            if 'symbology' in layer_config and layer_config['symbology'].get('type') == 'unique_values':
-                symbology = layer_config['symbology']
-                field = symbology['field']
-                attr_value = row.get(field)
-
-                # Find category label (case-insensitive)
-                category_label = None
-                if attr_value is not None:
-                    for sym_category in symbology['categories']:
-                        if any(str(attr_value).upper() == str(v).upper() for v in sym_category['values']):
-                            category_label = sym_category['label']
-                            break
-
-                # If not matched, check default category
-                if not category_label and 'default_category' in symbology:
-                    category_label = symbology['default_category']['label']
-
-                # Append category label to layer name (preserving INCOMPLETE suffix if present)
-                if category_label:
-                    layer_display_name = f"{display_layer_name} ({category_label})"
-                else:
-                    layer_display_name = f"{display_layer_name} (Unclassified)"
-
-            rows.append({
-                'category': category,
-                'layer_name': layer_display_name,
-                'area_name': str(area_name)
-            })
+        # Area names read from the column as a plain list; missing or blank values
+        # display as 'N/A'
+        area_names = [
+            'N/A' if value is None or (isinstance(value, str) and not value.strip()) else str(value)
+            for value in gdf[area_name_field].tolist()
+        ]
+
+        # Start with display_layer_name which may include "(INCOMPLETE)" suffix
+        symbology = layer_config.get('symbology')
+        if symbology and symbology.get('type') == 'unique_values':
+            symbology_field = symbology['field']
+            default_label = None
+            if 'default_category' in symbology:
+                default_label = symbology['default_category']['label']
+
+            def display_name(category_label):
+                """Append category label to layer name (preserving INCOMPLETE suffix if present)."""
+                return f"{display_layer_name} ({category_label or 'Unclassified'})"
+
+            if symbology_field in gdf.columns:
+                # Uppercased value -> category label (first matching category wins)
+                value_labels = {}
+                for sym_category in symbology['categories']:
+                    for value in sym_category['values']:
+                        value_labels.setdefault(str(value).upper(), sym_category['label'])
+
+                # Resolve the display name once per distinct value (case-insensitive
+                # match, falling back to the default category), then broadcast to
+                # the rows. Missing values (code -1) never match a category.
+                codes, uniques = pd.factorize(gdf[symbology_field])
+                unique_names = [
+                    display_name(value_labels.get(str(value).upper()) or default_label)
+                    for value in uniques
+                ]
+                unique_names.append(display_name(default_label))
+                layer_display_names = np.array(unique_names, dtype=object)[codes].tolist()
+            else:
+                layer_display_names = [display_name(default_label)] * len(area_names)
+        else:
+            layer_display_names = [display_layer_name] * len(area_names)
+
+        # Add one row per feature, extending each column in bulk
+        rows.categories.extend([category] * len(area_names))
+        rows.layer_names.extend(layer_display_names)
+        rows.area_names.extend(area_names)
 
     return rows
 
@@ -608,40 +669,38 @@ def generate_pdf_report(
         # Format with date and time (M/D/YYYY HH:MM:SS)
         report_date = f"{dt_central.month}/{dt_central.day}/{dt_central.year} {dt_central.strftime('%H:%M:%S')}"
 
-        # Create PDF
-        pdf = ReportPDF()
-
-        # Cover page
-        create_cover_page(pdf, project_name, project_id, report_date)
-
-        # Body table (automatically handles page breaks and header repetition)
-        create_body_table(pdf, table_rows, url_mapping, category_resources)
-
-        # BMP end page
         bmp_master_url = 'https://broadbandusa.ntia.gov/sites/default/files/2025-08/EHP_NTIA_BMPs_and_Mitigation_Measures_2025.pdf'
-        create_bmp_end_page(pdf, resource_links, bmp_master_url)
 
-        # Calculate total pages excluding cover page
-        total_pages = pdf.page_no()
-        total_pages_excluding_cover = total_pages - 1
+        def build_pdf(total_pages_excluding_cover: Optional[int]) -> ReportPDF:
+            """Lay out the full report; footers show the given page total."""
+            pdf = ReportPDF()
+            pdf.total_pages_excluding_cover = total_pages_excluding_cover
+
+            # Cover page
+            create_cover_page(pdf, project_name, project_id, report_date)
 
-        # Set the total in the PDF object (this will be used by footer on re-render)
-        pdf.total_pages_excluding_cover = total_pages_excluding_cover
+            # Body table (automatically handles page breaks and header repetition)
+            if table_rows:
+                create_body_table(pdf, table_rows, url_mapping, category_resources)
+            else:
+                create_empty_body_note(pdf, "No intersecting features found.")
 
-        # Re-create the PDF with the known total
-        # We need to rebuild because footers are already rendered with placeholder
-        pdf2 = ReportPDF()
-        pdf2.total_pages_excluding_cover = total_pages_excluding_cover
+            # BMP end page
+            create_bmp_end_page(pdf, resource_links, bmp_master_url)
+            return pdf
 
-        # Rebuild all pages with correct total
-        create_cover_page(pdf2, project_name, project_id, report_date)
-        create_body_table(pdf2, table_rows, url_mapping, category_resources)
-        create_bmp_end_page(pdf2, resource_links, bmp_master_url)
+        # The footer total excludes the cover page, which fpdf2's {nb} alias
+        # cannot express, so lay the report out once to count its pages and
+        # again with the known total
+        pdf = build_pdf(None)
+        pdf = build_pdf(pdf.page_no() - 1)
 
-        # Save PDF
+        # Save PDF (fpdf2 always assembles the document in memory and writes
+        # that buffer to the path in one call, so a file handle would not
+        # stream or save a copy)
         filename = f"PEIT_Report_{timestamp}.pdf"
         pdf_path = output_path / filename
-        pdf2.output(str(pdf_path))
+        pdf.output(str(pdf_path))
 
         logger.info(f"✓ PDF report saved: {filename} ({len(table_rows)} features)")
 
@@ -5,11 +5,59 @@ This module provides functions to format attribute values for display in map pop
 Handles special cases like URLs (converted to clickable links) and missing values.
 
 Functions:
+    escape_html: Escape a value for safe insertion into popup HTML
     format_popup_value: Format a single value for display in popup HTML
 """
 
+import functools
+import math
 from typing import Any
 
+# Value prefixes that mark a value as a link regardless of column name
+URL_SCHEMES = ('http://', 'https://')
+
+# HTML special characters escaped in popup values, applied in a single
+# str.translate pass
+HTML_ESCAPE_TABLE = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&#x27;',
+})
+
+# Anchor markup for URL values: (href, display text)
+URL_LINK_TEMPLATE = (
+    '<a href="%s" target="_blank" '
+    'style="word-break: break-all; color: #0066cc;">%s</a>'
+)
+
+
+def escape_html(value: Any) -> str:
+    """
+    Convert a value to text with HTML special characters escaped.
+
+    Use for any attribute data (names, column labels) inserted into popup
+    HTML; same output as html.escape.
+
+    Parameters:
+    -----------
+    value : Any
+        Value to escape (converted with str())
+
+    Returns:
+    --------
+    str
+        Escaped text
+    """
+    return str(value).translate(HTML_ESCAPE_TABLE)
+
+
+@functools.lru_cache(maxsize=512)
+def _is_url_column(col: str) -> bool:
+    """Return True if the column name marks a URL field (cached per name)."""
+    return 'url' in col.lower()
+
 
 def format_popup_value(col: str, value: Any) -> str:
     """
@@ -17,6 +65,7 @@ def format_popup_value(col: str, value: Any) -> str:
 
     Detects URLs in column names or values and converts them to HTML links.
     Long URLs are truncated for better display. None/NaN values are handled gracefully.
+    HTML special characters in values are escaped.
 
     Parameters:
     -----------
@@ -44,24 +93,21 @@ def format_popup_value(col: str, value: Any) -> str:
         '<a href="https://example.com" target="_blank">https://example.com</a>'
     """
     # Handle None and NaN values
-    if value is None or (isinstance(value, float) and value != value):  # NaN check
+    if value is None or (isinstance(value, float) and math.isnan(value)):
         return 'None'
 
     value_str = str(value)
 
     # Check if this is a URL field (by column name or value content)
-    is_url = 'url' in col.lower() or value_str.startswith(('http://', 'https://'))
+    is_url = _is_url_column(col) or value_str.startswith(URL_SCHEMES)
 
     if is_url:
-        # Truncate long URLs for display
+        # Truncate long URLs for display (before escaping, so an entity is never cut)
+        escaped = value_str.translate(HTML_ESCAPE_TABLE)
         if len(value_str) <= 60:
-            display_text = value_str
+            display_text = escaped
         else:
-            display_text = f"{value_str[:57]}..."
-
-        return (
-            f'<a href="{value_str}" target="_blank" '
-            f'style="word-break: break-all; color: #0066cc;">{display_text}</a>'
-        )
+            display_text = (value_str[:57] + '...').translate(HTML_ESCAPE_TABLE)
+        return URL_LINK_TEMPLATE % (escaped, display_text)
 
-    return value_str
+    return value_str.translate(HTML_ESCAPE_TABLE)
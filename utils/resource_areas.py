@@ -0,0 +1,97 @@
+"""
+Resource area mappings shared by the map and report generators.
+
+Resource areas are the NTIA BMP document sections linked from popups and
+reports. This module holds the category -> resource area codes mapping and
+the loader for config/resource_areas.json, so the map, PDF and XLSX code can
+use them without importing each other.
+
+Constants:
+    CATEGORY_RESOURCE_AREAS: Category (layer group) -> resource area codes
+
+Functions:
+    load_resource_areas: Load resource area code -> {name, url} mappings
+    get_category_resource_areas: Mapping from category to resource area codes
+"""
+
+import functools
+from pathlib import Path
+from typing import Dict, List
+
+from utils.json_helpers import load_json_file
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+# Category (group) -> resource area codes. Shared, treat as read-only.
+CATEGORY_RESOURCE_AREAS = {
+    'EPA Programs': ['1.4', '1.9', '1.11'],
+    'Federal/Tribal Land': ['1.7', '1.8'],
+    'Historic Places': ['1.8'],
+    'Floodplains': ['1.4', '1.5'],
+    'Infrastructure': ['1.1'],
+    'Critical Habitats': ['1.6', '1.10']
+}
+
+
+@functools.lru_cache(maxsize=4)
+def _read_resource_areas(resource_areas_file: Path) -> Dict[str, Dict[str, str]]:
+    """
+    Parse resource_areas.json into a code -> {name, url} mapping.
+
+    Cached per file path so repeated report runs in the same process parse
+    the file once. Errors propagate (and are not cached).
+
+    Args:
+        resource_areas_file: Path to resource_areas.json
+
+    Returns:
+        Dictionary mapping resource area codes to data
+    """
+    data = load_json_file(resource_areas_file)
+
+    # Convert list of dicts to code -> {name, URL} mapping
+    mapping = {}
+    for item in data:
+        code = item['resource_area'].replace('Resource Area ', '')
+        mapping[code] = {
+            'name': item['name'],
+            'url': item['url']
+        }
+
+    logger.debug(f"Loaded {len(mapping)} resource area mappings")
+    return mapping
+
+
+def load_resource_areas(config_dir: Path) -> Dict[str, Dict[str, str]]:
+    """
+    Load resource area mappings from JSON file.
+
+    The parsed mapping is cached and shared between calls, so callers must
+    not modify it.
+
+    Args:
+        config_dir: Path to configuration directory
+
+    Returns:
+        Dictionary mapping resource area codes to data
+        Example: {"1.4": {"name": "Water Resources", "url": "https://..."}}
+    """
+    try:
+        return _read_resource_areas(config_dir / 'resource_areas.json')
+
+    except Exception as e:
+        logger.error(f"Failed to load resource areas: {e}")
+        return {}
+
+
+def get_category_resource_areas() -> Dict[str, List[str]]:
+    """
+    Define mapping from category (group) to resource area codes.
+
+    Returns:
+        Dictionary mapping category names to lists of resource area codes
+        (the shared CATEGORY_RESOURCE_AREAS mapping; do not modify)
+    """
+    return CATEGORY_RESOURCE_AREAS
@@ -11,12 +11,18 @@ Functions:
 """
 
 import geopandas as gpd
+import numpy as np
+import shapely
 from pathlib import Path
 from pyproj import CRS
+from geometry_input.buffering import buffer_geometry_feet
+from utils.json_helpers import load_json_file
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+FEET_PER_MILE = 5280
+
 # Complete list of US states + territories for validation
 US_STATES = {
     'Alabama', 'Alaska', 'Arizona', 'Arkansas', 'California', 'Colorado',
@@ -35,17 +41,28 @@ US_STATES = {
 # Cache for state boundaries GeoDataFrame
 _state_boundaries_cache = None
 
+# Per-state (minx, miny, maxx, maxy) bounds, geometries and names, filled
+# alongside _state_boundaries_cache for the bbox prefilter
+_state_bounds = None
+_state_geoms = None
+_state_names = None
+
 
 def load_state_boundaries():
     """
     Load bundled US state boundaries GeoJSON.
 
-    Returns cached data if already loaded.
+    Returns cached data if already loaded. The small bundled file is parsed
+    as plain JSON and built with GeoDataFrame.from_features, which avoids
+    the GDAL/OGR driver setup cost of gpd.read_file on first use.
+
+    Also fills the module-level bounds, geometry and NAME arrays used by
+    get_intersecting_states, which never slices the GeoDataFrame itself.
 
     Returns:
         gpd.GeoDataFrame: US state boundaries with NAME column
     """
-    global _state_boundaries_cache
+    global _state_boundaries_cache, _state_bounds, _state_geoms, _state_names
 
     if _state_boundaries_cache is not None:
         return _state_boundaries_cache
@@ -59,7 +76,11 @@ def load_state_boundaries():
         return None
 
     try:
-        _state_boundaries_cache = gpd.read_file(geojson_path)
+        features = load_json_file(geojson_path)['features']
+        _state_boundaries_cache = gpd.GeoDataFrame.from_features(features, crs='EPSG:4326')
+        _state_geoms = np.asarray(_state_boundaries_cache.geometry.values, dtype=object)
+        _state_bounds = shapely.bounds(_state_geoms)
+        _state_names = _state_boundaries_cache['NAME'].to_numpy()
         logger.debug(f"Loaded {len(_state_boundaries_cache)} state boundaries")
         return _state_boundaries_cache
     except Exception as e:
@@ -67,13 +88,19 @@ def load_state_boundaries():
         return None
 
 
-def get_intersecting_states(polygon_gdf, buffer_miles=1.0):
+def get_intersecting_states(polygon_gdf, buffer_miles=1.0, buffered_geom=None):
     """
     Determine which US states intersect the buffered input geometry.
 
+    The buffer is applied in a projected CRS (see
+    geometry_input.buffering.buffer_geometry_feet), so the distance is in
+    true miles at any latitude rather than a fixed degrees approximation.
+
     Parameters:
         polygon_gdf (gpd.GeoDataFrame): Input polygon geometry in EPSG:4326
         buffer_miles (float): Buffer distance in miles for state detection
+        buffered_geom (BaseGeometry, optional): Already buffered input geometry
+            in EPSG:4326 (e.g. the clip boundary), reused instead of buffering again
 
     Returns:
         set: Set of state names that intersect the buffered geometry
@@ -85,20 +112,33 @@ def get_intersecting_states(polygon_gdf, buffer_miles=1.0):
         return set()
 
     try:
-        # Get the input geometry
-        input_geom = polygon_gdf.geometry.iloc[0]
+        if buffered_geom is None:
+            # Get the input geometry
+            input_geom = polygon_gdf.geometry.iloc[0]
+
+            if buffer_miles > 0:
+                buffered_geom = buffer_geometry_feet(
+                    input_geom, buffer_miles * FEET_PER_MILE, CRS.from_epsg(4326),
+                    verbose=False
+                )
+            else:
+                buffered_geom = input_geom
 
-        # Buffer the geometry for state detection
-        # Convert miles to degrees (approximate: 1 degree ~ 69 miles at equator)
-        # This is a rough approximation, but sufficient for state detection
-        buffer_degrees = buffer_miles / 69.0
-        buffered_geom = input_geom.buffer(buffer_degrees)
+        # Prepare the query geometry so GEOS indexes its edges once and
+        # reuses them for every candidate state predicate test
+        shapely.prepare(buffered_geom)
 
-        # Find intersecting states
-        intersecting = states_gdf[states_gdf.intersects(buffered_geom)]
+        # Cheap vectorized bbox overlap test first, then the exact
+        # intersects predicate only on the few surviving states
+        minx, miny, maxx, maxy = buffered_geom.bounds
+        candidates = np.flatnonzero(
+            (_state_bounds[:, 0] <= maxx) & (_state_bounds[:, 2] >= minx) &
+            (_state_bounds[:, 1] <= maxy) & (_state_bounds[:, 3] >= miny)
+        )
+        hits = candidates[shapely.intersects(_state_geoms[candidates], buffered_geom)]
 
         # Extract state names
-        state_names = set(intersecting['NAME'].tolist())
+        state_names = set(_state_names[hits])
 
         logger.debug(f"Input geometry intersects {len(state_names)} state(s): {state_names}")
         return state_names
@@ -108,6 +148,16 @@ def get_intersecting_states(polygon_gdf, buffer_miles=1.0):
         return set()
 
 
+def _layer_state_set(layer):
+    """Return the layer's 'states' field as a frozenset, or None if absent."""
+    layer_states = layer.get('states')
+    if layer_states is None:
+        return None
+    if isinstance(layer_states, list):
+        return frozenset(layer_states)
+    return frozenset({layer_states})
+
+
 def filter_layers_by_state(layers, intersecting_states):
     """
     Filter layer configs to only those relevant to intersecting states.
@@ -133,22 +183,18 @@ def filter_layers_by_state(layers, intersecting_states):
     filtered_layers = []
     skipped_layers = []
 
+    # Normalize each layer's states once, without touching the layer configs
+    state_sets = {layer['name']: _layer_state_set(layer) for layer in layers}
+
     for layer in layers:
-        layer_states = layer.get('states')
+        layer_state_set = state_sets[layer['name']]
 
-        if layer_states is None:
-            # No states field - always include (national/federal layer)
+        if layer_state_set is None or layer_state_set & intersecting_states:
+            # National/federal layer, or at least one state matches - include layer
             filtered_layers.append(layer)
         else:
-            # Check if any layer state matches intersecting states
-            layer_state_set = set(layer_states) if isinstance(layer_states, list) else {layer_states}
-
-            if layer_state_set & intersecting_states:
-                # At least one state matches - include layer
-                filtered_layers.append(layer)
-            else:
-                # No matching states - skip layer
-                skipped_layers.append(layer['name'])
+            # No matching states - skip layer
+            skipped_layers.append(layer['name'])
 
     skipped_count = len(skipped_layers)
 
@@ -13,68 +13,28 @@ The generated report includes:
       Each code has its own hyperlink to NTIA documentation, styled in blue with underline
 """
 
-import json
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Optional
 from datetime import datetime
 
 import geopandas as gpd
 from openpyxl import Workbook
 from openpyxl.styles import Font, Alignment, PatternFill
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.utils import get_column_letter
 
+from utils.resource_areas import get_category_resource_areas, load_resource_areas
+
 # Get logger
 logger = logging.getLogger(__name__)
 
-
-def load_resource_areas(config_dir: Path) -> Dict[str, str]:
-    """
-    Load resource area mappings from JSON file.
-
-    Args:
-        config_dir: Path to configuration directory
-
-    Returns:
-        Dictionary mapping resource area codes to URLs
-        Example: {"1.4": "https://...", "1.9": "https://..."}
-    """
-    resource_areas_file = config_dir / 'resource_areas.json'
-
-    try:
-        with open(resource_areas_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        # Convert list of dicts to code -> URL mapping
-        # Extract code from "Resource Area 1.4" -> "1.4"
-        mapping = {}
-        for item in data:
-            code = item['resource_area'].replace('Resource Area ', '')
-            mapping[code] = item['url']
-
-        logger.debug(f"Loaded {len(mapping)} resource area mappings")
-        return mapping
-
-    except Exception as e:
-        logger.error(f"Failed to load resource areas: {e}")
-        return {}
-
-
-def get_category_resource_areas() -> Dict[str, List[str]]:
-    """
-    Define mapping from category (group) to resource area codes.
-
-    Returns:
-        Dictionary mapping category names to lists of resource area codes
-    """
-    return {
-        'EPA Programs': ['1.4', '1.9', '1.11'],
-        'Federal/Tribal Land': ['1.7', '1.8'],
-        'Historic Places': ['1.8'],
-        'Floodplains': ['1.4', '1.5'],
-        'Infrastructure': ['1.1'],
-        'Critical Habitats': ['1.6', '1.10']
-    }
+# Shared cell styles (openpyxl style objects are immutable, so one instance
+# can be assigned to any number of cells)
+HEADER_FILL = PatternFill(start_color='366092', end_color='366092', fill_type='solid')
+HEADER_FONT = Font(bold=True, color='FFFFFF', size=11)
+HEADER_ALIGNMENT = Alignment(horizontal='center', vertical='center')
+HYPERLINK_FONT = Font(underline='single', color='0563C1')
 
 
 def create_resource_area_hyperlink(code: str, url_mapping: Dict[str, str]) -> str:
@@ -140,7 +100,9 @@ def generate_xlsx_report(
     try:
         # Load resource area URL mappings
         config_dir = Path(__file__).parent.parent / 'config'
-        url_mapping = load_resource_areas(config_dir)
+        url_mapping = {
+            code: data['url'] for code, data in load_resource_areas(config_dir).items()
+        }
 
         # Get category -> resource areas mapping
         category_resources = get_category_resource_areas()
@@ -148,27 +110,50 @@ def generate_xlsx_report(
         # Determine maximum number of resource areas across all categories
         max_resource_areas = max(len(codes) for codes in category_resources.values()) if category_resources else 0
 
-        # Create workbook and worksheet
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "Environmental Layers"
+        # Build each resource area's cell value (hyperlink formula) once
+        formula_by_code = {
+            code: create_resource_area_hyperlink(code, url_mapping)
+            for codes in category_resources.values()
+            for code in codes
+        }
+
+        # Create a write-only workbook: rows are streamed to the file instead
+        # of being kept as Cell objects for the whole sheet
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Environmental Layers")
 
         # Define dynamic headers
         headers = ['Category', 'Layer Name', 'Area Name']
         for i in range(1, max_resource_areas + 1):
             headers.append(f'Resource Area {i}')
 
-        ws.append(headers)
+        # Column widths and frozen header must be set before rows are written
+        for col_num in range(1, len(headers) + 1):
+            column_letter = get_column_letter(col_num)
+
+            # Set reasonable widths
+            if col_num == 1:  # Category
+                ws.column_dimensions[column_letter].width = 25
+            elif col_num == 2:  # Layer Name
+                ws.column_dimensions[column_letter].width = 40
+            elif col_num == 3:  # Area Name
+                ws.column_dimensions[column_letter].width = 35
+            else:  # Resource Area columns (4+)
+                ws.column_dimensions[column_letter].width = 18
+
+        # Freeze header row
+        ws.freeze_panes = 'A2'
 
         # Style header row
-        header_fill = PatternFill(start_color='366092', end_color='366092', fill_type='solid')
-        header_font = Font(bold=True, color='FFFFFF', size=11)
+        header_cells = []
+        for header in headers:
+            cell = WriteOnlyCell(ws, value=header)
+            cell.fill = HEADER_FILL
+            cell.font = HEADER_FONT
+            cell.alignment = HEADER_ALIGNMENT
+            header_cells.append(cell)
 
-        for col_num, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col_num)
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.alignment = Alignment(horizontal='center', vertical='center')
+        ws.append(header_cells)
 
         # Build layer name -> config mapping for easy lookup
         layer_config_map = {layer['name']: layer for layer in config['layers']}
@@ -180,10 +165,9 @@ def generate_xlsx_report(
                 if isinstance(lmeta, dict) and lmeta.get('results_incomplete', False):
                     incomplete_layers.add(lname)
 
-        # Track total rows added
-        row_count = 0
-
-        # Process each layer with intersected features
+        # Validate layers up front so the writing loop below only sees
+        # non-empty layers with a usable area name field
+        layers_to_write = []
         for layer_name, gdf in layer_results.items():
             if gdf.empty:
                 logger.debug(f"Skipping empty layer: {layer_name}")
@@ -211,41 +195,78 @@ def generate_xlsx_report(
                 )
                 continue
 
+            layers_to_write.append((layer_name, gdf, layer_config, category, area_name_field))
+
+        # Track total rows added
+        row_count = 0
+        append_row = ws.append
+
+        # Process each layer with intersected features
+        for layer_name, gdf, layer_config, category, area_name_field in layers_to_write:
             # Get resource area codes for this category
             resource_codes = category_resources.get(category, [])
 
+            # Resource area cells are the same for every feature of the layer,
+            # padded with empty cells if fewer resource areas than max
+            resource_cells = [formula_by_code[code] for code in resource_codes]
+            resource_cells.extend([''] * (max_resource_areas - len(resource_cells)))
+            for i, value in enumerate(resource_cells):
+                if value.startswith('=HYPERLINK'):
+                    # Blue hyperlink styling; rows are serialized as they are
+                    # appended, so one styled cell can be reused on every row
+                    cell = WriteOnlyCell(ws, value=value)
+                    cell.font = HYPERLINK_FONT
+                    resource_cells[i] = cell
+
             # Add "(INCOMPLETE)" suffix if results are incomplete
             display_layer_name = layer_name
             if layer_name in incomplete_layers:
                 display_layer_name = f"{layer_name} (INCOMPLETE)"
 
+            # Pull the needed columns out once instead of building a Series
+            # per feature with iterrows
+            area_names = gdf[area_name_field].astype(object).to_numpy()
+
+            # Unique value symbology appends a category label to the layer name
+            symbology = layer_config.get('symbology')
+            if not (symbology and symbology.get('type') == 'unique_values'):
+                symbology = None
+            else:
+                if symbology['field'] in gdf.columns:
+                    attr_values = gdf[symbology['field']].astype(object).to_numpy()
+                else:
+                    attr_values = [None] * len(gdf)
+
+                # Uppercased symbology value -> category label (first match wins),
+                # built once per layer for case-insensitive lookups
+                label_map = {}
+                for sym_category in symbology['categories']:
+                    for v in sym_category['values']:
+                        label_map.setdefault(str(v).upper(), sym_category['label'])
+                default_label = symbology.get('default_category', {}).get('label')
+
             # Add one row per feature
-            for idx, row in gdf.iterrows():
-                area_name = row.get(area_name_field, 'N/A')
-
-                # Handle null/empty values
-                if area_name is None or (isinstance(area_name, str) and not area_name.strip()):
-                    area_name = 'N/A'
-
-                # Check if layer uses unique value symbology
-                # Start with display_layer_name which may include "(INCOMPLETE)" suffix
-                layer_display_name = display_layer_name
-                if 'symbology' in layer_config and layer_config['symbology'].get('type') == 'unique_values':
-                    symbology = layer_config['symbology']
-                    field = symbology['field']
-                    attr_value = row.get(field)
-
-                    # Find category label (case-insensitive)
+            if symbology is None:
+                for area_name in area_names:
+                    # Handle null/empty values
+                    if area_name is None or (isinstance(area_name, str) and not area_name.strip()):
+                        area_name = 'N/A'
+
+                    # Build row data with separate columns for each resource area
+                    append_row([category, display_layer_name, str(area_name), *resource_cells])
+            else:
+                for area_name, attr_value in zip(area_names, attr_values):
+                    # Handle null/empty values
+                    if area_name is None or (isinstance(area_name, str) and not area_name.strip()):
+                        area_name = 'N/A'
+
+                    # Find category label (case-insensitive), falling back to
+                    # the default category if not matched
                     category_label = None
                     if attr_value is not None:
-                        for sym_category in symbology['categories']:
-                            if any(str(attr_value).upper() == str(v).upper() for v in sym_category['values']):
-                                category_label = sym_category['label']
-                                break
-
-                    # If not matched, check default category
-                    if not category_label and 'default_category' in symbology:
-                        category_label = symbology['default_category']['label']
+                        category_label = label_map.get(str(attr_value).upper())
+                    if not category_label:
+                        category_label = default_label
 
                     # Append category label to layer name (preserving INCOMPLETE suffix if present)
                     if category_label:
@@ -253,46 +274,10 @@ def generate_xlsx_report(
                     else:
                         layer_display_name = f"{display_layer_name} (Unclassified)"
 
-                # Build row data with separate columns for each resource area
-                row_data = [category, layer_display_name, str(area_name)]
-
-                # Add individual resource area hyperlinks
-                for code in resource_codes:
-                    hyperlink_formula = create_resource_area_hyperlink(code, url_mapping)
-                    row_data.append(hyperlink_formula)
-
-                # Pad with empty cells if fewer resource areas than max
-                while len(row_data) < len(headers):
-                    row_data.append('')
-
-                # Add data row
-                ws.append(row_data)
-                current_row = ws.max_row
+                    # Build row data with separate columns for each resource area
+                    append_row([category, layer_display_name, str(area_name), *resource_cells])
 
-                # Apply blue hyperlink styling to resource area cells
-                for col_idx in range(4, 4 + len(resource_codes)):
-                    cell = ws.cell(row=current_row, column=col_idx)
-                    if cell.value and str(cell.value).startswith('=HYPERLINK'):
-                        cell.font = Font(underline='single', color='0563C1')
-
-                row_count += 1
-
-        # Auto-adjust column widths
-        for col_num in range(1, len(headers) + 1):
-            column_letter = get_column_letter(col_num)
-
-            # Set reasonable widths
-            if col_num == 1:  # Category
-                ws.column_dimensions[column_letter].width = 25
-            elif col_num == 2:  # Layer Name
-                ws.column_dimensions[column_letter].width = 40
-            elif col_num == 3:  # Area Name
-                ws.column_dimensions[column_letter].width = 35
-            else:  # Resource Area columns (4+)
-                ws.column_dimensions[column_letter].width = 18
-
-        # Freeze header row
-        ws.freeze_panes = 'A2'
+            row_count += len(gdf)
 
         # Generate filename with timestamp
         filename = f"PEIT_Report_{timestamp}.xlsx"